@@ -0,0 +1,521 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures the cold start of a plugin invocation, like Kodi does it for
+every click: a fresh interpreter imports srgssr, creates a SRGSSR
+instance and builds one menu.
+
+Every route runs in its own process, with the Kodi modules and
+simplecache replaced by the in-memory stand-ins of kodi_stubs. The HTTP
+responses are served from fixtures, so no network is needed. The report
+contains the median time of every phase:
+
+    startup  -- interpreter start and loading of this harness
+    import   -- import srgssr
+    init     -- SRGSSR(...)
+    route    -- building the menu
+    total    -- wall time of the process
+
+followed by the slowest imports (python -X importtime, Python 3.7+).
+
+By default synthetic fixtures are used. Real responses can be recorded
+(needs network access and requests) and used later:
+
+    python benchmarks/bench_cold_start.py --record fixtures.json
+    python benchmarks/bench_cold_start.py --fixtures fixtures.json
+
+Other options:
+
+    --repeat N  -- number of processes per route (default: 5)
+    --warm      -- fill the cache first (like a second visit of the menu)
+    --route R   -- only run the given route (can be repeated)
+
+The module requests must be installed, since srgssr uses it to send the
+(fixture) requests.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HARNESS_START = time.time()
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+LIB_DIR = os.path.join(BENCHMARK_DIR, os.pardir, 'lib')
+sys.path[:0] = [BENCHMARK_DIR, LIB_DIR]
+
+BU = 'srf'
+ADDON_ID = 'plugin.video.srfplaytv'
+HOST_URL = 'https://www.srf.ch'
+NUMBER_OF_SHOWS = 800
+NUMBER_OF_FAVOURITES = 10
+NUMBER_OF_TOPIC_VIDEOS = 30
+NUMBER_OF_LIVE_EVENTS = 3
+MAIN_MENU_IDENTIFIERS = [
+    'All_Shows', 'Favourite_Shows', 'Newest_Favourite_Shows',
+    'Recommendations', 'Newest_Shows', 'Most_Clicked_Shows', 'Soon_Offline',
+    'Shows_By_Date', 'Live_TV', 'SRF_Live', 'Search', 'SRF_YouTube',
+]
+
+# The routes of the main menu which do not need another add-on
+# (like YouTube):
+ROUTES = [
+    ('main_menu',
+     lambda plugin: plugin.build_main_menu(MAIN_MENU_IDENTIFIERS)),
+    ('all_shows', lambda plugin: plugin.build_all_shows_menu()),
+    ('favourite_shows', lambda plugin: plugin.build_favourite_shows_menu()),
+    ('newest_favourite_shows',
+     lambda plugin: plugin.build_newest_favourite_menu()),
+    ('trending', lambda plugin: plugin.build_topics_menu('Trending')),
+    ('newest_shows',
+     lambda plugin: plugin.build_topics_overview_menu('Newest')),
+    ('most_clicked',
+     lambda plugin: plugin.build_topics_menu('Most clicked', 'topic-0')),
+    ('soon_offline', lambda plugin: plugin.build_topics_menu('Soon offline')),
+    ('shows_by_date', lambda plugin: plugin.build_dates_overview_menu()),
+    ('live_tv', lambda plugin: plugin.build_live_menu()),
+    ('srf_live', lambda plugin: plugin.build_live_menu(extract_srf3=True)),
+    ('search', lambda plugin: plugin.build_search_menu()),
+]
+ROUTE_NAMES = [name for name, _ in ROUTES]
+
+# Modules which are only needed by some routes:
+OPTIONAL_MODULES = ('requests', 'youtube_channels')
+
+
+def show_ids():
+    return ['show-%04d' % index for index in range(NUMBER_OF_SHOWS)]
+
+
+def video_id(index):
+    return '%08x-0000-4000-8000-%012x' % (index, index)
+
+
+def media_composition(vid, index):
+    """
+    Returns a mediaComposition response of a video with one chapter.
+    """
+    return {
+        'chapterUrn': 'urn:%s:video:%s' % (BU, vid),
+        'episode': {'id': 'episode-%d' % index,
+                    'title': 'Episode %d' % index},
+        'show': {
+            'id': 'show-%04d' % (index % NUMBER_OF_SHOWS),
+            'title': 'Show %d' % index,
+            'bannerImageUrl': 'https://ws.srf.ch/asset/banner/%d/16x9' % (
+                index),
+        },
+        'chapterList': [{
+            'id': vid,
+            'title': 'Video %d' % index,
+            'lead': 'Lead of video %d' % index,
+            'description': 'Description of video %d' % index,
+            'imageUrl': 'https://ws.srf.ch/asset/image/%s/16x9' % vid,
+            'duration': 1800000,
+            'date': '2018-05-%02dT20:00:00+02:00' % (index % 28 + 1),
+            'resourceList': [{
+                'url': 'https://srf-vod.akamaized.net/%s/%s.m3u8' % (
+                    vid, quality),
+                'quality': quality,
+                'protocol': 'HLS',
+            } for quality in ('HD', 'SD')],
+            'segmentList': [],
+        }],
+    }
+
+
+def synthetic_fixtures():
+    """
+    Generates the responses needed by the routes, as a dictionary
+    mapping the URLs to dictionaries with the keys 'status', 'headers'
+    and 'body'.
+    """
+    def response(data):
+        return {'status': 200, 'headers': {}, 'body': json.dumps(data)}
+
+    fixtures = {}
+    shows = [{
+        'id': sid,
+        'title': 'Show %d' % index,
+        'lead': 'Lead of show %d' % index,
+        'description': 'Description of show %d' % index,
+        'Image': {'ImageRepresentations': {'ImageRepresentation': [
+            {'url': 'https://ws.srf.ch/asset/image/%s/WEBVISUAL' % sid}]}},
+    } for index, sid in enumerate(show_ids())]
+    fixtures[(
+        'http://il.srgssr.ch/integrationlayer/1.0/ue/%s/tv/assetGroup/'
+        'editorialPlayerAlphabetical.json') % BU] = response(
+            {'AssetGroups': {'Show': shows}})
+
+    fixtures[HOST_URL + '/play/tv/topicList'] = response([
+        {'id': 'topic-%d' % index, 'title': 'Topic %d' % index}
+        for index in range(12)])
+
+    # Webpages of the topic menus (the ids are embedded as entity encoded
+    # JSON) and the media compositions of their videos:
+    number = NUMBER_OF_TOPIC_VIDEOS
+    topic_urls = [
+        '%s/play/tv/videos/trending?numberOfVideos=50&onlyEpisodes=true'
+        '&includeEditorialPicks=true' % HOST_URL,
+        '%s/play/tv/topic/topic-0/mostClicked?numberOfVideos=50' % HOST_URL,
+        '%s/play/tv/videos/soon-offline-videos?numberOfVideos=50' % (
+            HOST_URL),
+    ]
+    for offset, url in enumerate(topic_urls):
+        indexes = range(offset * number, (offset + 1) * number)
+        fixtures[url] = {'status': 200, 'headers': {}, 'body': (
+            '<html><body><div data-app-state="%s"></div></body></html>' % (
+                ','.join('{&quot;id&quot;:&quot;%s&quot;}' % video_id(i)
+                         for i in indexes)))}
+        for index in indexes:
+            fixtures[(
+                'https://il.srgssr.ch/integrationlayer/2.0/%s/'
+                'mediaComposition/video/%s.json') % (
+                    BU, video_id(index))] = response(
+                        media_composition(video_id(index), index))
+
+    # Livestreams: the live event ids on the main page, the events of the
+    # swisstxt API and the Radio SRF 3 videos:
+    fixtures[HOST_URL] = {'status': 200, 'headers': {}, 'body': ''.join(
+        '<div data-sport-id="%d"></div>' % (1000 + index)
+        for index in range(NUMBER_OF_LIVE_EVENTS))}
+    for index in range(NUMBER_OF_LIVE_EVENTS):
+        fixtures[(
+            'https://event.api.swisstxt.ch/v1/events/%s/byEventItemId/'
+            '?eids=%d') % (BU, 1000 + index)] = response([{
+                'title': 'Live event %d' % index,
+                'hls': 'https://srgssrlive.akamaized.net/%d.m3u8' % index,
+                'imageUrl': 'https://ws.srf.ch/asset/live/%d' % index,
+                'streamType': 'hls',
+            }])
+    srf3_indexes = range(3 * number, 3 * number + NUMBER_OF_LIVE_EVENTS)
+    fixtures['https://www.srf.ch/radio-srf-3'] = {
+        'status': 200, 'headers': {}, 'body': ''.join(
+            '<a href="/popupvideoplayer?id=%s"></a>' % video_id(index)
+            for index in srf3_indexes)}
+    for index in srf3_indexes:
+        fixtures[(
+            'https://il.srgssr.ch/integrationlayer/2.0/%s/'
+            'mediaComposition/video/%s.json') % (
+                BU, video_id(index))] = response(
+                    media_composition(video_id(index), index))
+
+    now = datetime.datetime.now()
+    till_month = datetime.date.today().strftime('%m-%Y')
+    for sid in show_ids()[:NUMBER_OF_FAVOURITES]:
+        url = ('%s/play/tv/show/%s/latestEpisodes?numberOfEpisodes=10&'
+               'tillMonth=%s') % (HOST_URL, sid, till_month)
+        fixtures[url] = response({
+            'show': {'bannerImageUrl': 'https://ws.srf.ch/%s/16x9' % sid},
+            'episodes': [{
+                'id': '%s-episode-%d' % (sid, index),
+                'title': 'Episode %d' % index,
+                'lead': 'Lead',
+                'imageUrl': 'https://ws.srf.ch/%s/%d/16x9' % (sid, index),
+                'duration': 1800000,
+                'date': (now - datetime.timedelta(days=index)).strftime(
+                    '%d.%m.%Y, %H:%M'),
+            } for index in range(10)],
+        })
+    return fixtures
+
+
+class FixtureResponse(object):
+    """
+    A stand-in for requests.Response.
+    """
+    def __init__(self, fixture):
+        self.status_code = fixture['status']
+        self.ok = self.status_code < 400
+        self.headers = fixture.get('headers', {})
+        self.text = fixture.get('body', '')
+        self.content = self.text.encode('utf-8')
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for index in range(0, len(self.content), chunk_size):
+            yield self.content[index:index + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FixtureSession(object):
+    """
+    A stand-in for requests.Session serving the fixtures. Unknown URLs
+    are answered with 404.
+    """
+    def __init__(self, fixtures):
+        self.fixtures = fixtures
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return FixtureResponse(self.fixtures.get(url, {'status': 404}))
+
+
+class RecordingSession(object):
+    """
+    Wraps a requests.Session and records the responses as fixtures.
+    """
+    def __init__(self, session):
+        self.session = session
+        self.fixtures = {}
+
+    def get(self, url, **kwargs):
+        kwargs.pop('stream', None)
+        response = self.session.get(url, **kwargs)
+        self.fixtures[url] = {
+            'status': response.status_code,
+            'headers': {},
+            'body': response.text,
+        }
+        return response
+
+
+def prepare_profile(profile):
+    """
+    Writes the favourite shows into the profile directory.
+
+    Keyword arguments:
+    profile  -- the profile directory
+    """
+    with open(os.path.join(profile, 'favourite_shows.json'), 'w') as f:
+        json.dump(
+            [{'id': sid} for sid in show_ids()[:NUMBER_OF_FAVOURITES]], f)
+
+
+def run_child(args):
+    """
+    Runs one route and prints the timings of its phases as JSON.
+    """
+    phases = {}
+    start = time.time()
+    import kodi_stubs
+    kodi_stubs.install(profile=args.profile)
+    kodi_stubs.load_cache(args.cache_file)
+    phases['stubs'] = time.time() - start
+
+    start = time.time()
+    import srgssr
+    phases['import'] = time.time() - start
+
+    start = time.time()
+    plugin = srgssr.SRGSSR(1, bu=BU, addon_id=ADDON_ID)
+    phases['init'] = time.time() - start
+
+    with open(args.fixtures) as f:
+        plugin.session = FixtureSession(json.load(f))
+    route = dict(ROUTES)[args.child]
+    start = time.time()
+    route(plugin)
+    phases['route'] = time.time() - start
+    phases['child'] = time.time() - HARNESS_START
+
+    if args.cache_file:
+        kodi_stubs.save_cache(args.cache_file)
+    print('RESULT ' + json.dumps({
+        'phases': phases,
+        'items': len(kodi_stubs.ITEMS),
+        'requests': len(plugin.session.urls),
+        'calls': kodi_stubs.CALLS,
+        'loaded': [name for name in OPTIONAL_MODULES
+                   if name in sys.modules] + (
+                       ['simplecache'] if kodi_stubs.CALLS['SimpleCache']
+                       else []),
+    }))
+
+
+def record(path, routes):
+    """
+    Runs the routes against the real services and writes the responses
+    into a fixtures file.
+
+    Keyword arguments:
+    path    -- the path of the fixtures file
+    routes  -- the names of the routes
+    """
+    import kodi_stubs
+    import requests
+    profile = tempfile.mkdtemp()
+    try:
+        prepare_profile(profile)
+        kodi_stubs.install(profile=profile)
+        import srgssr
+        recorder = RecordingSession(requests.Session())
+        for name in routes:
+            plugin = srgssr.SRGSSR(1, bu=BU, addon_id=ADDON_ID)
+            plugin.session = recorder
+            dict(ROUTES)[name](plugin)
+            print('recorded %s' % name)
+    finally:
+        shutil.rmtree(profile)
+    with open(path, 'w') as f:
+        json.dump(recorder.fixtures, f)
+    print('%d responses written to %s' % (len(recorder.fixtures), path))
+
+
+def parse_import_times(stderr):
+    """
+    Parses the output of python -X importtime and returns a dictionary
+    mapping the top level imports to their cumulative time in seconds.
+    """
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.startswith('  ') or not cumulative.strip().isdigit():
+            continue  # nested import or header
+        times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def run_process(args, route, fixtures, profile, cache_file):
+    command = [sys.executable]
+    if sys.version_info >= (3, 7):
+        command += ['-X', 'importtime']
+    command += [os.path.abspath(__file__), '--child', route,
+                '--fixtures', fixtures, '--profile', profile]
+    if cache_file:
+        command += ['--cache-file', cache_file]
+    start = time.time()
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    stdout, stderr = process.communicate()
+    wall_time = time.time() - start
+    results = [line[len('RESULT '):] for line in stdout.splitlines()
+               if line.startswith('RESULT ')]
+    if process.returncode or not results:
+        raise RuntimeError('Route %s failed:\n%s' % (route, stderr))
+    result = json.loads(results[-1])
+    phases = result['phases']
+    phases['total'] = wall_time
+    phases['startup'] = wall_time - phases.pop('child') + phases.pop('stubs')
+    result['imports'] = parse_import_times(stderr)
+    return result
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def baseline(repeat):
+    """
+    Returns the median time to start and stop the interpreter.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', 'pass'])
+        times.append(time.time() - start)
+    return median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure the cold start of the plugin routes.')
+    parser.add_argument('--route', action='append', choices=ROUTE_NAMES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warm', action='store_true',
+                        help='fill the cache before measuring')
+    parser.add_argument('--fixtures', help='a recorded fixtures file')
+    parser.add_argument('--record', metavar='PATH',
+                        help='record fixtures from the real services')
+    parser.add_argument('--top', type=int, default=10,
+                        help='number of imports to list (default: 10)')
+    parser.add_argument('--child', choices=ROUTE_NAMES,
+                        help=argparse.SUPPRESS)
+    parser.add_argument('--profile', help=argparse.SUPPRESS)
+    parser.add_argument('--cache-file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    routes = args.route or ROUTE_NAMES
+
+    if args.child:
+        run_child(args)
+        return
+    if args.record:
+        record(args.record, routes)
+        return
+
+    workdir = tempfile.mkdtemp()
+    try:
+        profile = os.path.join(workdir, 'profile')
+        os.mkdir(profile)
+        prepare_profile(profile)
+        fixtures = args.fixtures
+        if not fixtures:
+            fixtures = os.path.join(workdir, 'fixtures.json')
+            with open(fixtures, 'w') as f:
+                json.dump(synthetic_fixtures(), f)
+
+        print('interpreter start (python -c pass): %6.1f ms' % (
+            baseline(args.repeat) * 1000))
+        header = ('%-24s' + ' %9s' * 5 + ' %6s %5s  %s') % (
+            'route (median ms)', 'startup', 'import', 'init', 'route',
+            'total', 'items', 'reqs', 'loaded')
+        print(header)
+        print('-' * len(header))
+        imports = {}
+        for route in routes:
+            cache_file = None
+            if args.warm:
+                cache_file = os.path.join(workdir, route + '.cache')
+                run_process(args, route, fixtures, profile, cache_file)
+            results = [
+                run_process(args, route, fixtures, profile, cache_file)
+                for _ in range(args.repeat)]
+            phases = dict(
+                (phase, median([r['phases'][phase] for r in results]) * 1000)
+                for phase in ('startup', 'import', 'init', 'route', 'total'))
+            last = results[-1]
+            print(('%-24s' + ' %9.1f' * 5 + ' %6d %5d  %s') % (
+                route, phases['startup'], phases['import'], phases['init'],
+                phases['route'], phases['total'], last['items'],
+                last['requests'], ','.join(last['loaded']) or '-'))
+            for result in results:
+                for name, seconds in result['imports'].items():
+                    imports.setdefault(name, []).append(seconds)
+
+        if imports:
+            print('\nslowest imports (median cumulative ms over all runs):')
+            slowest = sorted(
+                ((median(times), name) for name, times in imports.items()),
+                reverse=True)[:args.top]
+            for seconds, name in slowest:
+                print('  %8.2f  %s' % (seconds * 1000, name))
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares utils.find_unique_ids with the former regex based
+implementation of SRGSSR.extract_id_list on generated webpages of
+several megabytes (entity encoded JavaScript on a single line, as on the
+Play pages).
+
+The former editor picks regex scans the rest of the line for every id
+after the last editor pick (quadratic), so it is only run on the
+smallest page unless --all is given.
+
+Usage: python benchmarks/bench_extract_id_list.py [--all]
+"""
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lib'))
+
+import utils  # noqa: E402
+
+IDREGEX = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+'
+
+
+def regex_based_id_list(string_response, editor_picks=False):
+    """
+    The former implementation of SRGSSR.extract_id_list (without the
+    download).
+    """
+    readable_string_response = string_response.replace('&quot;', '"')
+    id_regex = r'''(?x)
+                    \"id\"
+                    \s*:\s*
+                    \"
+                    (?P<id>
+                        %s
+                    )
+                    \"
+                ''' % IDREGEX
+    if editor_picks:
+        id_regex += r'.+\"isEditorPick\"\s*:\s*true'
+    return [m.group('id') for m in re.finditer(
+        id_regex, readable_string_response)]
+
+
+def generate_page(size, seed=0):
+    """
+    Generates a webpage of (at least) a given size in bytes. Every video
+    occurs twice, the first ten videos are editor picks (like a teaser at
+    the top of the page).
+
+    Keyword arguments:
+    size  -- the size of the page
+    seed  -- the seed of the random generator (default: 0)
+    """
+    rnd = random.Random(seed)
+    parts = ['<html><body><div data-app-state="']
+    length = len(parts[0])
+    index = 0
+    while length < size:
+        vid = '%08x-%04x-%04x-%04x-%012x' % (
+            rnd.getrandbits(32), rnd.getrandbits(16), rnd.getrandbits(16),
+            rnd.getrandbits(16), rnd.getrandbits(48))
+        for _ in range(2):
+            part = (
+                '{&quot;id&quot;:&quot;%s&quot;,&quot;title&quot;:'
+                '&quot;Video %d&quot;,&quot;description&quot;:&quot;%s'
+                '&quot;,&quot;isEditorPick&quot;:%s},' % (
+                    vid, index, 'x' * rnd.randint(100, 400),
+                    'true' if index < 10 else 'false'))
+            parts.append(part)
+            length += len(part)
+        index += 1
+    parts.append('"></div></body></html>')
+    return ''.join(parts)
+
+
+def measure(function, *args):
+    start = time.time()
+    result = function(*args)
+    return time.time() - start, result
+
+
+def main():
+    run_all = '--all' in sys.argv[1:]
+    for megabytes in (1, 4, 16):
+        page = generate_page(megabytes * 1024 * 1024)
+        for editor_picks in (False, True):
+            flag = 'isEditorPick' if editor_picks else None
+            new_time, new_ids = measure(
+                utils.find_unique_ids, page, IDREGEX, flag)
+            line = '%2d MB  editor_picks=%-5s  find_unique_ids: %7.3fs' % (
+                megabytes, editor_picks, new_time)
+            if not editor_picks or megabytes == 1 or run_all:
+                old_time, old_ids = measure(
+                    regex_based_id_list, page, editor_picks)
+                line += '  regex based: %7.3fs (%d ids, %d unique)' % (
+                    old_time, len(old_ids), len(new_ids))
+            else:
+                line += '  regex based: skipped (use --all)'
+            print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares the throughput of utils.parse_datetime with the former
+implementation (without precompiled regexes and memo) on mixed-format
+date strings, once with repeated strings (as they occur in the menus)
+and once with unique strings (memo misses only).
+
+Usage: python benchmarks/bench_parse_datetime.py [number_of_strings]
+"""
+
+import datetime
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lib'))
+
+import utils  # noqa: E402
+
+
+def former_parse_datetime(input_string):
+    """
+    The former implementation of utils.parse_datetime (before the regexes
+    were precompiled and the results memoized).
+
+    Tries to create a datetime object from a given input string. There are
+    several different forms of input strings supported, for more details
+    have a look in the documentations of the called functions. In case
+    of failure, a NoneType will be returned.
+
+    Keyword arguments:
+    input_string -- a string to convert into a datetime object
+    """
+    date_time = _former_parse_weekday_time(input_string)
+    if date_time:
+        return date_time
+    date_time = _former_parse_date_time(input_string)
+    if date_time:
+        return date_time
+    date_time = _former_parse_date_time_tz(input_string)
+    return date_time
+
+
+def _former_parse_date_time_tz(input_string):
+    """
+    Creates a datetime object from a string of the form
+    %Y-%m-%dT%H:%M:%S<tz>
+    where <tz> represents the timezone info and is of the form
+    (+|-)%H:%M.
+    A NoneType will be returned in the case where it was not possible
+    to create a datetime object.
+
+    Keyword arguments:
+    input_string -- a string of the above form
+    """
+    dt_regex = r'''(?x)
+                    (?P<dt>
+                        \d{4}-\d{2}-\d{2}T\d{2}(:|h)\d{2}:\d{2}
+                    )
+                    (?P<tz>
+                        (?:[-+]\d{2}(:|h)\d{2}|Z)
+                    )
+                '''
+    match = re.match(dt_regex, input_string)
+    if match:
+        dts = match.group('dt')
+        # We ignore timezone information for now
+        try:
+            # Strange behavior of strptime in Kodi?
+            # dt = datetime.datetime.strptime(dts, '%Y-%m-%dT%H:%M:%S')
+            # results in a TypeError in some cases...
+            year = int(dts[0:4])
+            month = int(dts[5:7])
+            day = int(dts[8:10])
+            hour = int(dts[11:13])
+            minute = int(dts[14:16])
+            second = int(dts[17:19])
+            date_time = datetime.datetime(
+                year, month, day, hour, minute, second)
+            return date_time
+        except ValueError:
+            return None
+    return None
+
+
+def _former_parse_weekday_time(input_string):
+    """
+    Creates a datetime object from a string of the form
+    <weekday>,? %H:%M(:S)?
+    where <weekday> is either a german name of a weekday
+    ('Montag', 'Dienstag', ...) or 'gestern', 'heute', 'morgen'.
+    Other supported languages are English, French and Italian.
+    If it is not possible to create a datetime object from
+    the given input string, a NoneType will be returned.
+
+    Keyword arguments:
+    input_string -- a string of the above form
+    """
+    weekdays_german = (
+        'Montag',
+        'Dienstag',
+        'Mittwoch',
+        'Donnerstag',
+        'Freitag',
+        'Samstag',
+        'Sonntag',
+    )
+    special_weekdays_german = (
+        'gestern',
+        'heute',
+        'morgen',
+    )
+    identifiers_german = weekdays_german + special_weekdays_german
+
+    weekdays_french = (
+        'Lundi',
+        'Mardi',
+        'Mercredi',
+        'Jeudi',
+        'Vendredi',
+        'Samedi',
+        'Dimanche',
+    )
+    special_weekdays_french = (
+        'hier',
+        'aujourd\'hui',
+        'demain',
+    )
+    identifiers_french = weekdays_french + special_weekdays_french
+
+    weekdays_italian = (
+        'Lunedì',
+        'Martedì',
+        'Mercoledì',
+        'Giovedì',
+        'Venerdì',
+        'Sabato',
+        'Domenica',
+    )
+    special_weekdays_italian = (
+        'ieri',
+        'oggi',
+        'domani',
+    )
+    identifiers_italian = weekdays_italian + special_weekdays_italian
+
+    weekdays_english = (
+        'Monday',
+        'Tuesday',
+        'Wednesday',
+        'Thursday',
+        'Friday',
+        'Saturday',
+        'Sunday',
+    )
+    special_weekdays_english = (
+        'yesterday',
+        'today',
+        'tomorrow',
+    )
+    identifiers_english = weekdays_english + special_weekdays_english
+
+    identifiers = {
+        'german': identifiers_german,
+        'french': identifiers_french,
+        'italian': identifiers_italian,
+        'english': identifiers_english,
+    }
+
+    recent_date_regex = r'''(?x)
+                            (?P<weekday>[a-zA-z\'ì]+)
+                            \s*,\s*
+                            (?P<hour>\d{2})(:|h)
+                            (?P<minute>\d{2})
+                            (:
+                                (?P<second>\d{2})
+                            )?
+                        '''
+    recent_date_match = re.match(recent_date_regex, input_string)
+    if recent_date_match:
+        # This depends on correct date settings in Kodi...
+        today = datetime.date.today()
+        # wdl = [x for x in weekdays if input_string.startswith(x)]
+        for key in list(identifiers.keys()):
+            wdl = [x for x in identifiers[key] if re.match(
+                x, input_string, re.IGNORECASE)]
+            lang = key
+            if wdl:
+                break
+        if not wdl:
+            return None
+        index = identifiers[lang].index(wdl[0])
+        if index == 9:  # tomorrow
+            offset = datetime.timedelta(1)
+        elif index == 8:  # today
+            offset = datetime.timedelta(0)
+        elif index == 7:  # yesterday
+            offset = datetime.timedelta(-1)
+        else:  # Monday, Tuesday, ..., Sunday
+            days_off_pos = (today.weekday() - index) % 7
+            offset = datetime.timedelta(-days_off_pos)
+        try:
+            hour = int(recent_date_match.group('hour'))
+            minute = int(recent_date_match.group('minute'))
+            time = datetime.time(hour, minute)
+        except ValueError:
+            return None
+        try:
+            second = int(recent_date_match.group('second'))
+            time = datetime.time(hour, minute, second)
+        except (ValueError, TypeError):
+            pass
+        date_time = datetime.datetime.combine(today, time) + offset
+    else:
+        return None
+    return date_time
+
+
+def _former_parse_date_time(input_string):
+    """
+    Creates a datetime object from a string of the following form:
+    %d.%m.%Y,? %H:%M(:%S)?
+
+    Note that the delimiter between the date and the time is optional, and also
+    the seconds in the time are optional.
+
+    If the given string cannot be transformed into a appropriate datetime
+    object, a NoneType will be returned.
+
+    Keyword arguments:
+    input_string -- the date and time in the above form
+    """
+    full_date_regex = r'''(?x)
+                        (?P<day>\d{2})\.
+                        (?P<month>\d{2})\.
+                        (?P<year>\d{4})
+                        \s*,?\s*
+                        (?P<hour>\d{2})(:|h)
+                        (?P<minute>\d{2})
+                        (:
+                            (?P<second>\d{2})
+                        )?
+                    '''
+    full_date_match = re.match(full_date_regex, input_string)
+    if full_date_match:
+        try:
+            year = int(full_date_match.group('year'))
+            month = int(full_date_match.group('month'))
+            day = int(full_date_match.group('day'))
+            hour = int(full_date_match.group('hour'))
+            minute = int(full_date_match.group('minute'))
+            date_time = datetime.datetime(year, month, day, hour, minute)
+        except ValueError:
+            return None
+        try:
+            second = int(full_date_match.group('second'))
+            date_time = datetime.datetime(
+                year, month, day, hour, minute, second)
+            return date_time
+        except (ValueError, TypeError):
+            return date_time
+    return None
+
+
+def generate_strings(number, unique=False, seed=0):
+    """
+    Generates a list of date strings in all the formats supported by
+    utils.parse_datetime.
+
+    Keyword arguments:
+    number  -- the number of strings to generate
+    unique  -- if set, (almost) all the strings are distinct, otherwise
+               they are drawn from a pool of 1000 strings (default: False)
+    seed    -- the seed of the random generator (default: 0)
+    """
+    rnd = random.Random(seed)
+    if not unique:
+        pool = generate_strings(1000, unique=True, seed=seed)
+        return [rnd.choice(pool) for _ in range(number)]
+    identifiers = [
+        identifier for identifiers in utils.WEEKDAY_IDENTIFIERS.values()
+        for identifier in identifiers]
+    strings = []
+    for _ in range(number):
+        hour = rnd.randint(0, 23)
+        minute = rnd.randint(0, 59)
+        second = rnd.randint(0, 59)
+        day = rnd.randint(1, 28)
+        month = rnd.randint(1, 12)
+        year = rnd.randint(2000, 2030)
+        kind = rnd.randint(0, 3)
+        if kind == 0:
+            strings.append(u'%s, %02d:%02d' % (
+                rnd.choice(identifiers), hour, minute))
+        elif kind == 1:
+            strings.append(u'%02d.%02d.%04d, %02d:%02d:%02d' % (
+                day, month, year, hour, minute, second))
+        elif kind == 2:
+            strings.append(u'%04d-%02d-%02dT%02d:%02d:%02d+01:00' % (
+                year, month, day, hour, minute, second))
+        else:
+            strings.append(u'%02d.%02d.%04d %02dh%02d' % (
+                day, month, year, hour, minute))
+    return strings
+
+
+def run(strings, function=utils.parse_datetime):
+    """
+    Parses all the given strings and returns the number of parsed
+    strings per second.
+
+    Keyword arguments:
+    strings   -- a list of date strings
+    function  -- the parse function (default: utils.parse_datetime)
+    """
+    utils._parse_datetime_memo.clear()
+    start = time.time()
+    for string in strings:
+        function(string)
+    return len(strings) / (time.time() - start)
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for label, unique in (('repeated', False), ('unique', True)):
+        strings = generate_strings(number, unique=unique)
+        new = run(strings)
+        old = run(strings, former_parse_datetime)
+        print('parse_datetime (%s strings, n=%d): %.0f strings/s, '
+              'former: %.0f strings/s, speedup: %.1fx' % (
+                  label, number, new, old, new / old))
+
+
+if __name__ == '__main__':
+    main()
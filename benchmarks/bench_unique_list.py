@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares the set based utils.iter_unique with the former list based
+implementation of utils.generate_unique_list on merged radio catalogs
+of 1k, 10k and 100k shows (spread over 20 channels, a third of the shows
+is featured by two channels).
+
+The list based implementation is quadratic, the 100k case takes a few
+minutes.
+
+Usage: python benchmarks/bench_unique_list.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lib'))
+
+import utils  # noqa: E402
+
+
+def list_based_unique_list(input, unique_key):
+    """
+    The former implementation of utils.generate_unique_list.
+    """
+    unique_keys = []
+    output = []
+    for li in input:
+        for elem in li:
+            if elem[unique_key] not in unique_keys:
+                unique_keys.append(elem[unique_key])
+                output.append(elem)
+    return output
+
+
+def generate_channels(number_of_shows, number_of_channels=20, seed=0):
+    """
+    Generates a list of per-channel show lists.
+
+    Keyword arguments:
+    number_of_shows     -- the number of distinct shows
+    number_of_channels  -- the number of channels (default: 20)
+    seed                -- the seed of the random generator (default: 0)
+    """
+    rnd = random.Random(seed)
+    channels = [[] for _ in range(number_of_channels)]
+    for index in range(number_of_shows):
+        show = {'id': 'show-%d' % index, 'title': 'Show %d' % index}
+        channel_ids = [rnd.randrange(number_of_channels)]
+        if index % 3 == 0:
+            channel_ids.append(rnd.randrange(number_of_channels))
+        for channel_id in channel_ids:
+            channels[channel_id].append(show)
+    return channels
+
+
+def measure(function, channels):
+    start = time.time()
+    result = function(channels)
+    return time.time() - start, len(result)
+
+
+def main():
+    for number in (1000, 10000, 100000):
+        channels = generate_channels(number)
+        new_time, new_count = measure(
+            lambda chs: list(utils.iter_unique(chs, key=lambda k: k['id'])),
+            channels)
+        old_time, old_count = measure(
+            lambda chs: list_based_unique_list(chs, 'id'), channels)
+        assert old_count == new_count
+        print('n=%6d  iter_unique: %8.4fs  list based: %8.4fs  '
+              'speedup: %.0fx' % (number, new_time, old_time,
+                                  old_time / max(new_time, 1e-9)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Micro-benchmarks for the functions of utils which run for every item of
+every list: try_get, get_duration, parse_datetime, str_or_none and
+assemble_query_string.
+
+Every case calls the function on a fixed, seeded mix of synthetic
+inputs (nested mediaComposition paths including missing keys and wrong
+types, all the duration forms, date strings in all the formats and in
+all four weekday languages, ...). For every case the report contains:
+
+    ops/s    -- calls per second (best of --repeat runs)
+    peak B   -- peak traced memory per call (tracemalloc, Python 3)
+    blocks   -- allocated blocks per 1000 calls which are still alive
+                after the run (e.g. memo entries)
+    baseline -- the ratio to the ops/s stored in the baseline file for
+                the running Python version
+
+Usage:
+
+    python benchmarks/bench_utils.py [--repeat N] [--case NAME]
+    python benchmarks/bench_utils.py --save-baseline
+    python benchmarks/bench_utils.py --check 0.9
+
+--check exits with status 1 if a case is slower than the given fraction
+of its baseline. The baseline (baseline_utils.json next to this file) is
+machine dependent, so it is not part of the repository: save it with
+--save-baseline on the machine where the comparison is done, before the
+change to be measured.
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [BENCHMARK_DIR, os.path.join(BENCHMARK_DIR, os.pardir, 'lib')]
+
+import utils  # noqa: E402
+from bench_parse_datetime import generate_strings  # noqa: E402
+
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, 'baseline_utils.json')
+NUMBER_OF_INPUTS = 1000
+MIN_TIME = 0.2  # seconds per run
+
+
+def media_composition(rnd, index):
+    """
+    Generates a dictionary shaped like a mediaComposition response.
+    """
+    vid = '%08x-%04x-%04x-%04x-%012x' % (
+        rnd.getrandbits(32), rnd.getrandbits(16), rnd.getrandbits(16),
+        rnd.getrandbits(16), rnd.getrandbits(48))
+    return {
+        'chapterUrn': 'urn:srf:video:%s' % vid,
+        'episode': {
+            'id': 'episode-%d' % index,
+            'title': u'Episode %d' % index,
+            'imageUrl': 'https://ws.srf.ch/asset/image/%d/16x9' % index,
+        },
+        'show': {
+            'id': 'show-%d' % (index % 50),
+            'title': u'Show %d' % (index % 50),
+            'bannerImageUrl': 'https://ws.srf.ch/asset/banner/%d' % index,
+        },
+        'chapterList': [{
+            'id': vid,
+            'title': u'Chapter %d' % chapter,
+            'duration': rnd.randint(60000, 7200000),
+            'resourceList': [{
+                'url': 'https://srf-vod.akamaized.net/%s/%s.m3u8' % (
+                    vid, quality),
+                'quality': quality,
+                'protocol': 'HLS',
+            } for quality in ('HD', 'SD')],
+            'subtitleList': [{
+                'url': 'https://ws.srf.ch/subtitles/%s.vtt' % vid,
+                'format': 'VTT',
+            }] if chapter % 2 else [],
+            'segmentList': [],
+        } for chapter in range(rnd.randint(1, 3))],
+    }
+
+
+# Paths as they are used in srgssr, with the expected data type:
+TRY_GET_PATHS = [
+    (('chapterList', 0, 'resourceList', 0, 'url'), utils.CompatStr),
+    (('chapterList', 0, 'subtitleList', 0, 'url'), utils.CompatStr),
+    (('chapterList', 0, 'duration'), int),
+    (('chapterList', 2, 'title'), utils.CompatStr),  # often missing
+    (('episode', 'imageUrl'), utils.CompatStr),
+    (('show', 'bannerImageUrl'), utils.CompatStr),
+    (('show', 'lead'), utils.CompatStr),  # missing key
+    (('chapterList',), list),
+    ('chapterUrn', utils.CompatStr),
+    ('show', dict),
+    (('episode', 'title'), int),  # wrong type
+    (('show', 'title', 'x'), utils.CompatStr),  # TypeError
+]
+
+
+def generate_cases(seed=0):
+    """
+    Returns a list of the benchmark cases as tuples
+    (name, function, list of argument tuples).
+
+    Keyword arguments:
+    seed  -- the seed of the random generator (default: 0)
+    """
+    rnd = random.Random(seed)
+    compositions = [media_composition(rnd, index) for index in range(50)]
+    try_get_inputs = []
+    for _ in range(NUMBER_OF_INPUTS):
+        keys, data_type = rnd.choice(TRY_GET_PATHS)
+        try_get_inputs.append(
+            (rnd.choice(compositions), keys, data_type))
+
+    durations = []
+    for _ in range(NUMBER_OF_INPUTS):
+        kind = rnd.randint(0, 5)
+        if kind == 0:
+            duration = u'%d:%02d:%02d' % (
+                rnd.randint(1, 3), rnd.randint(0, 59), rnd.randint(0, 59))
+        elif kind == 1:
+            duration = u'%d:%02d' % (rnd.randint(0, 59), rnd.randint(0, 59))
+        elif kind == 2:
+            duration = u'%d' % rnd.randint(0, 5000)
+        elif kind == 3:
+            duration = rnd.randint(60000, 7200000)  # not a string
+        elif kind == 4:
+            duration = None
+        else:
+            duration = u''
+        durations.append((duration,))
+
+    strings = []
+    for _ in range(NUMBER_OF_INPUTS):
+        kind = rnd.randint(0, 3)
+        if kind == 0:
+            strings.append(((
+                u'https://www.srf.ch/play/tv/%d' % rnd.randint(0, 100)
+            ).encode('utf-8'),))
+        elif kind == 1:
+            strings.append((u'Sendung %d' % rnd.randint(0, 100),))
+        elif kind == 2:
+            strings.append((None,))
+        else:
+            strings.append((rnd.randint(0, 100),))
+
+    queries = []
+    for _ in range(NUMBER_OF_INPUTS):
+        query = [('mode', rnd.randint(10, 70))]
+        if rnd.random() < 0.8:
+            query.append(('name', 'show-%d' % rnd.randint(0, 1000)))
+        if rnd.random() < 0.3:
+            query.append(('page', rnd.randint(1, 10)))
+        if rnd.random() < 0.2:
+            query.append(('page_hash', '%016x' % rnd.getrandbits(64)))
+        queries.append((query,))
+
+    return [
+        ('try_get', utils.try_get, try_get_inputs),
+        ('get_duration', utils.get_duration, durations),
+        ('parse_datetime', utils.parse_datetime, [
+            (string,) for string in generate_strings(
+                NUMBER_OF_INPUTS, seed=seed)]),
+        ('parse_datetime_unique', utils.parse_datetime, [
+            (string,) for string in generate_strings(
+                NUMBER_OF_INPUTS, unique=True, seed=seed)]),
+        ('str_or_none', utils.str_or_none, strings),
+        ('assemble_query_string', utils.assemble_query_string, queries),
+    ]
+
+
+def run_pass(function, inputs):
+    """
+    Calls the function for all the inputs. Every pass starts with empty
+    memos, like a plugin invocation building one list.
+    """
+    utils._parse_datetime_memo.clear()
+    for args in inputs:
+        function(*args)
+
+
+def measure_speed(function, inputs, repeat):
+    """
+    Returns the best number of calls per second of several runs.
+    """
+    best = 0
+    for _ in range(repeat):
+        calls = 0
+        start = time.time()
+        elapsed = 0
+        while elapsed < MIN_TIME:
+            run_pass(function, inputs)
+            calls += len(inputs)
+            elapsed = time.time() - start
+        best = max(best, calls / elapsed)
+    return best
+
+
+def measure_allocations(function, inputs):
+    """
+    Returns a tuple (peak bytes per call, retained blocks per 1000
+    calls) of one pass over the inputs. The peak is None if tracemalloc
+    is not available.
+    """
+    utils._parse_datetime_memo.clear()
+    gc.collect()
+    peak = None
+    blocks_before = sys.getallocatedblocks() \
+        if hasattr(sys, 'getallocatedblocks') else None
+    if tracemalloc:
+        tracemalloc.start()
+        run_pass(function, inputs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak = float(peak) / len(inputs)
+    else:
+        run_pass(function, inputs)
+    gc.collect()
+    blocks = None
+    if blocks_before is not None:
+        blocks = 1000.0 * (
+            sys.getallocatedblocks() - blocks_before) / len(inputs)
+    return peak, blocks
+
+
+def python_version():
+    return '%d.%d' % sys.version_info[:2]
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_FILE) as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Micro-benchmarks for the utils module.')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--case', action='append',
+                        help='only run the given case (can be repeated)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='store the results as the new baseline')
+    parser.add_argument('--check', type=float, metavar='RATIO',
+                        help='fail if a case is slower than RATIO times '
+                             'its baseline')
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    version_baseline = baseline.get(python_version(), {})
+    results = {}
+    slower = []
+    print('%-24s %12s %9s %9s %9s' % (
+        'case', 'ops/s', 'peak B', 'blocks', 'baseline'))
+    for name, function, inputs in generate_cases():
+        if args.case and name not in args.case:
+            continue
+        ops = measure_speed(function, inputs, args.repeat)
+        peak, blocks = measure_allocations(function, inputs)
+        results[name] = {'ops': ops, 'peak': peak, 'blocks': blocks}
+        ratio = None
+        if name in version_baseline:
+            ratio = ops / version_baseline[name]['ops']
+            if args.check and ratio < args.check:
+                slower.append(name)
+        print('%-24s %12.0f %9s %9s %9s' % (
+            name, ops,
+            '-' if peak is None else '%.1f' % peak,
+            '-' if blocks is None else '%.1f' % blocks,
+            '-' if ratio is None else '%.2fx' % ratio))
+
+    if args.save_baseline:
+        version_baseline.update(results)
+        baseline[python_version()] = version_baseline
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print('Baseline for Python %s written to %s' % (
+            python_version(), BASELINE_FILE))
+    if slower:
+        print('Slower than %.2f times the baseline: %s' % (
+            args.check, ', '.join(slower)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+In-memory stand-ins for the Kodi modules (xbmc, xbmcgui, xbmcplugin,
+xbmcaddon, also available through kodi_six) and for simplecache, so that
+the library can be imported and run outside of Kodi by the benchmarks.
+
+The stand-ins only implement what the library uses. They record the
+directory items (ITEMS), the log messages (LOG) and the number of calls
+into "Kodi" (CALLS), and they do not cost more than a dictionary lookup.
+
+Usage:
+
+    import kodi_stubs
+    kodi_stubs.install(profile='/tmp/profile')
+    import srgssr
+"""
+
+import os
+import pickle
+import sys
+import time
+import types
+
+
+# Settings returned by xbmcaddon.Addon.getSetting. Settings which are not
+# listed here are 'true' (this enables all the menu entries).
+SETTINGS = {
+    'Enable_Debugging': 'false',
+    'Stale_While_Revalidate': 'false',
+    'Hedged_Requests': 'false',
+    'Number_Of_Workers': '8',
+}
+
+ITEMS = []
+LOG = []
+CALLS = {'getSetting': 0, 'getLocalizedString': 0, 'getAddonInfo': 0,
+         'addDirectoryItem': 0, 'addDirectoryItems': 0, 'SimpleCache': 0}
+_CONFIG = {'profile': ''}
+
+
+class Addon(object):
+    def __init__(self, id=None):
+        self.id = id or 'script.module.srgssr'
+
+    def getAddonInfo(self, key):
+        CALLS['getAddonInfo'] += 1
+        return {
+            'id': self.id,
+            'name': 'SRG SSR',
+            'version': '0.0.0',
+            'icon': 'icon.png',
+            'fanart': 'fanart.jpg',
+            'profile': _CONFIG['profile'],
+            'path': _CONFIG['profile'],
+        }.get(key, '')
+
+    def getSetting(self, key):
+        CALLS['getSetting'] += 1
+        return SETTINGS.get(key, 'true')
+
+    def setSetting(self, key, value):
+        SETTINGS[key] = value
+
+    def getLocalizedString(self, string_id):
+        CALLS['getLocalizedString'] += 1
+        return 'String %d' % string_id
+
+
+class ListItem(object):
+    def __init__(self, label='', label2='', path=None, offscreen=False):
+        self.label = label
+        self.path = path
+        self.properties = {}
+        self.art = {}
+        self.info = {}
+
+    def setLabel(self, label):
+        self.label = label
+
+    def setPath(self, path):
+        self.path = path
+
+    def setProperty(self, key, value):
+        self.properties[key] = value
+
+    def setArt(self, art):
+        self.art.update(art)
+
+    def setInfo(self, media_type, info):
+        self.info.update(info)
+
+    def setSubtitles(self, subtitles):
+        self.properties['subtitles'] = subtitles
+
+    def setMimeType(self, mime_type):
+        self.properties['mimetype'] = mime_type
+
+    def setContentLookup(self, enable):
+        pass
+
+
+class Dialog(object):
+    def notification(self, *args, **kwargs):
+        LOG.append(('notification', args))
+
+    def input(self, *args, **kwargs):
+        return ''
+
+    def numeric(self, *args, **kwargs):
+        return ''
+
+    def select(self, *args, **kwargs):
+        return -1
+
+    def multiselect(self, *args, **kwargs):
+        return None
+
+    def ok(self, *args, **kwargs):
+        return True
+
+
+def _log(msg, level=0):
+    LOG.append((level, msg))
+
+
+def _add_directory_item(handle, url, listitem, isFolder=False,
+                        totalItems=0):
+    CALLS['addDirectoryItem'] += 1
+    ITEMS.append((url, listitem, isFolder))
+    return True
+
+
+def _add_directory_items(handle, items, totalItems=0):
+    CALLS['addDirectoryItems'] += 1
+    ITEMS.extend(items)
+    return True
+
+
+class SimpleCache(object):
+    """
+    An in-memory replacement of simplecache.SimpleCache. The entries are
+    shared by all instances (like the cache database of the add-on).
+    """
+    store = {}
+
+    def __init__(self):
+        CALLS['SimpleCache'] += 1
+
+    def get(self, endpoint, checksum=''):
+        entry = self.store.get(endpoint)
+        if entry is None or entry[1] < time.time():
+            return None
+        return entry[0]
+
+    def set(self, endpoint, data, checksum='', expiration=None):
+        seconds = expiration.total_seconds() if expiration else 30 * 86400
+        self.store[endpoint] = (data, time.time() + seconds)
+
+
+def load_cache(path):
+    """
+    Loads the entries of the SimpleCache stand-in from a file (written by
+    save_cache). Missing files are ignored.
+
+    Keyword arguments:
+    path  -- the path of the file
+    """
+    if path and os.path.exists(path):
+        with open(path, 'rb') as f:
+            SimpleCache.store.update(pickle.load(f))
+
+
+def save_cache(path):
+    """
+    Saves the entries of the SimpleCache stand-in to a file.
+
+    Keyword arguments:
+    path  -- the path of the file
+    """
+    with open(path, 'wb') as f:
+        pickle.dump(SimpleCache.store, f, protocol=2)
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+def install(profile=''):
+    """
+    Registers the stand-ins in sys.modules.
+
+    Keyword arguments:
+    profile  -- the directory returned as the profile of the add-ons
+                (default: '')
+    """
+    _CONFIG['profile'] = profile
+    xbmc = _module(
+        'xbmc', LOGDEBUG=0, LOGINFO=1, LOGNOTICE=2, LOGWARNING=3,
+        LOGERROR=4, log=_log, translatePath=lambda path: path,
+        getInfoLabel=lambda label: '', executebuiltin=lambda command: None,
+        Monitor=object)
+    xbmcgui = _module('xbmcgui', ListItem=ListItem, Dialog=Dialog)
+    xbmcplugin = _module(
+        'xbmcplugin', addDirectoryItem=_add_directory_item,
+        addDirectoryItems=_add_directory_items,
+        endOfDirectory=lambda *args, **kwargs: None,
+        setResolvedUrl=lambda *args, **kwargs: None,
+        setContent=lambda *args, **kwargs: None,
+        addSortMethod=lambda *args, **kwargs: None,
+        SORT_METHOD_NONE=0)
+    xbmcaddon = _module('xbmcaddon', Addon=Addon)
+    kodi_six = _module(
+        'kodi_six', xbmc=xbmc, xbmcgui=xbmcgui, xbmcplugin=xbmcplugin,
+        xbmcaddon=xbmcaddon)
+    simplecache = _module('simplecache', SimpleCache=SimpleCache)
+    for module in (xbmc, xbmcgui, xbmcplugin, xbmcaddon, kodi_six,
+                   simplecache):
+        sys.modules[module.__name__] = module
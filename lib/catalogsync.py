@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Background synchronisation of the show catalogs into the add-on cache.
+
+From a Kodi service of a plugin:
+
+    import catalogsync
+    import srgssr
+    catalogsync.CatalogSync(
+        srgssr.SRGSSR(-1, bu='srf', addon_id=ADDON_ID)).run(xbmc.Monitor())
+
+As a script inside of Kodi (the Kodi modules and simplecache are not
+available outside of Kodi):
+
+    RunScript(special://home/addons/script.module.srgssr/lib/catalogsync.py,
+              --bu=srf, --addon-id=plugin.video.srfplaytv, --once)
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import srgssr
+
+
+SYNC_INTERVAL = 60 * 60  # seconds
+SYNC_JITTER = 0.2
+REQUEST_BUDGET = 100
+
+
+class CatalogSync(object):
+    """
+    Periodically refreshes the datasets needed by the catalog heavy
+    menus (all shows, radio channels and radio shows) in the background,
+    so that the menus find them in the cache.
+    """
+    def __init__(self, plugin, interval=SYNC_INTERVAL, jitter=SYNC_JITTER,
+                 request_budget=REQUEST_BUDGET):
+        """
+        Keyword arguments:
+        plugin          -- a SRGSSR instance
+        interval        -- the mean time between two synchronisations in
+                           seconds (default: SYNC_INTERVAL)
+        jitter          -- the maximal relative deviation of the interval
+                           (default: SYNC_JITTER)
+        request_budget  -- the maximal number of HTTP requests per
+                           synchronisation; further requests are not
+                           sent (default: REQUEST_BUDGET)
+        """
+        self.plugin = plugin
+        self.interval = interval
+        self.jitter = jitter
+        self.request_budget = request_budget
+        self.cache_id = plugin.addon_id + '.catalog_sync'
+
+    def tasks(self):
+        """
+        Returns a list of the synchronisation tasks as tuples
+        (name, function).
+        """
+        plugin = self.plugin
+        tasks = [
+            ('radio_channels', plugin.get_radio_channels),
+            ('radio_shows',
+             lambda: plugin.extract_shows_information('radio')),
+        ]
+        if plugin.bu != 'swi':
+            tasks.insert(0, ('all_shows', plugin.read_all_shows_records))
+        return tasks
+
+    def next_delay(self):
+        """
+        Returns the jittered time in seconds until the next
+        synchronisation.
+        """
+        return self.interval * (
+            1 + random.uniform(-self.jitter, self.jitter))
+
+    def sync_once(self, force=False):
+        """
+        Runs all the synchronisation tasks (as long as the request budget
+        allows it). Returns the names of the completed tasks. Unless
+        forced, nothing is done if another process synchronised recently.
+
+        Keyword arguments:
+        force  -- ignore the time of the last synchronisation
+                  (default: False)
+        """
+        plugin = self.plugin
+        last_sync = plugin.cache.get(self.cache_id)
+        if not force and last_sync and \
+                time.time() - last_sync < self.interval / 2.0:
+            plugin.log('CatalogSync: Synchronised recently, skipping.')
+            return []
+        plugin.cache.set(self.cache_id, time.time())
+
+        plugin.json_memo.clear()
+        plugin.show_catalogs.clear()
+        plugin.revalidate = True
+        plugin.quiet = True
+        start_count = plugin.request_count
+        plugin.request_limit = start_count + self.request_budget
+        completed = []
+        try:
+            for name, task in self.tasks():
+                used = plugin.request_count - start_count
+                if used >= self.request_budget:
+                    plugin.log('CatalogSync: Request budget exhausted '
+                               '(%d requests), skipping %s.' % (used, name))
+                    break
+                try:
+                    task()
+                except Exception:
+                    plugin.log('CatalogSync: Task %s failed.' % name)
+                    continue
+                if plugin.request_count >= plugin.request_limit:
+                    # Requests of the task may have been skipped
+                    plugin.log('CatalogSync: Request budget exhausted '
+                               'during %s.' % name)
+                    break
+                completed.append(name)
+        finally:
+            plugin.revalidate = False
+            plugin.quiet = False
+            plugin.request_limit = None
+            plugin.save_latencies()
+        plugin.log('CatalogSync: Completed %s with %d requests.' % (
+            completed, plugin.request_count - start_count))
+        return completed
+
+    def run(self, monitor=None):
+        """
+        Synchronises periodically until the monitor requests an abort
+        (or forever, if no monitor is given).
+
+        Keyword arguments:
+        monitor  -- a xbmc.Monitor instance (default: None)
+        """
+        while True:
+            self.sync_once()
+            delay = self.next_delay()
+            if monitor is not None:
+                if monitor.waitForAbort(delay):
+                    return
+            else:
+                time.sleep(delay)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Synchronise the SRG SSR show catalogs into the cache.')
+    parser.add_argument('--bu', default='srf')
+    parser.add_argument('--addon-id', default=srgssr.ADDON_ID)
+    parser.add_argument('--interval', type=float, default=SYNC_INTERVAL)
+    parser.add_argument('--budget', type=int, default=REQUEST_BUDGET)
+    parser.add_argument('--once', action='store_true',
+                        help='synchronise once and exit')
+    args = parser.parse_args(argv)
+
+    plugin = srgssr.SRGSSR(-1, bu=args.bu, addon_id=args.addon_id)
+    sync = CatalogSync(
+        plugin, interval=args.interval, request_budget=args.budget)
+    if args.once:
+        sync.sync_once(force=True)
+    else:
+        sync.run()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+import re
+import unicodedata
+
+import utils
+
+
+class ShowCatalog(object):
+    """
+    An ordered collection of shows with an index by show id.
+
+    Every show is a dictionary with the keys 'id', 'title', 'description',
+    'lead', 'imageUrl' and 'bannerImageUrl' (as returned by
+    SRGSSR.extract_shows_information).
+    """
+    def __init__(self, shows):
+        """
+        Keyword arguments:
+        shows  -- a list of show dictionaries; shows without id and
+                  duplicates (by id) are skipped
+        """
+        self.shows = []
+        self._positions = {}
+        self._search_index = None
+        for show in shows:
+            show_id = show.get('id')
+            if not show_id or show_id in self._positions:
+                continue
+            self._positions[show_id] = len(self.shows)
+            self.shows.append(show)
+
+    @staticmethod
+    def normalize_asset_group_show(jse):
+        """
+        Converts a show of the integration layer's show list into a show
+        dictionary of the catalog. Returns an empty dictionary if the
+        show has no title or id.
+
+        Keyword arguments:
+        jse  -- the show of the integration layer
+        """
+        title = utils.try_get(jse, 'title')
+        show_id = utils.try_get(jse, 'id')
+        if not (title and show_id):
+            return {}
+        image_url = utils.try_get(
+            jse,
+            ('Image', 'ImageRepresentations',
+             'ImageRepresentation', 0, 'url'))
+        banner = None
+        if image_url:
+            image_url = re.sub(r'/\d+x\d+', '', image_url)
+            banner = image_url.replace('WEBVISUAL', 'HEADER_SRF_PLAYER')
+        return {
+            'id': show_id,
+            'title': title,
+            'description': utils.try_get(jse, 'description'),
+            'lead': utils.try_get(jse, 'lead'),
+            'imageUrl': image_url,
+            'bannerImageUrl': banner,
+        }
+
+    def __len__(self):
+        return len(self.shows)
+
+    def __iter__(self):
+        return iter(self.shows)
+
+    def __contains__(self, show_id):
+        return show_id in self._positions
+
+    def index(self, show_id):
+        """
+        Returns the position of a show in the catalog, or None if the show
+        is not in the catalog.
+
+        Keyword arguments:
+        show_id  -- the id of the show
+        """
+        return self._positions.get(show_id)
+
+    def select(self, show_ids):
+        """
+        Returns the shows for the given ids in the order of the catalog.
+        Ids which are not in the catalog are ignored. The effort only
+        depends on the number of the given ids.
+
+        Keyword arguments:
+        show_ids  -- an iterable of show ids
+        """
+        positions = set(
+            self._positions[sid] for sid in show_ids if sid in self._positions)
+        return [self.shows[position] for position in sorted(positions)]
+
+    def ids(self):
+        """
+        Returns a list of all the show ids in the order of the catalog.
+        """
+        return [show['id'] for show in self.shows]
+
+    def titles(self):
+        """
+        Returns a list of all the show titles in the order of the catalog.
+        """
+        return [show['title'] for show in self.shows]
+
+    def search(self, query):
+        """
+        Searches the shows by title, lead and description without using
+        the network. Every word of the query must be contained in one of
+        these fields (case and accent insensitive). Shows with matches in
+        the title come first, otherwise the order of the catalog is kept.
+
+        Keyword arguments:
+        query  -- the search query
+        """
+        if self._search_index is None:
+            self._search_index = ShowSearchIndex(self.shows)
+        return [self.shows[position]
+                for position in self._search_index.search(query)]
+
+
+def normalize_text(text):
+    """
+    Converts a text to lower case and removes the accents.
+
+    Keyword arguments:
+    text  -- the text to normalize
+    """
+    if not isinstance(text, utils.CompatStr):
+        text = text.decode('utf-8')
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return u''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def trigrams(word):
+    """
+    Returns the set of trigrams of a word.
+
+    Keyword arguments:
+    word  -- the word
+    """
+    return set(word[i:i + 3] for i in range(len(word) - 2))
+
+
+class ShowSearchIndex(object):
+    """
+    A trigram index over the title, lead and description of a list of
+    shows. The index answers substring queries; the candidates found by
+    the trigrams are verified against the normalized texts.
+    """
+    WORD_REGEX = re.compile(r'\w+', re.UNICODE)
+
+    def __init__(self, shows):
+        """
+        Keyword arguments:
+        shows  -- a list of show dictionaries
+        """
+        self._titles = []
+        self._texts = []
+        self._trigrams = {}
+        for position, show in enumerate(shows):
+            title = normalize_text(show.get('title') or '')
+            text = u' '.join(
+                normalize_text(show.get(field) or '')
+                for field in ('title', 'lead', 'description'))
+            self._titles.append(title)
+            self._texts.append(text)
+            for word in set(self.WORD_REGEX.findall(text)):
+                for trigram in trigrams(word):
+                    self._trigrams.setdefault(trigram, set()).add(position)
+
+    def search(self, query):
+        """
+        Returns the positions of the matching shows.
+
+        Keyword arguments:
+        query  -- the search query
+        """
+        words = self.WORD_REGEX.findall(normalize_text(query))
+        if not words:
+            return []
+        candidates = None
+        for word in words:
+            for trigram in trigrams(word):
+                postings = self._trigrams.get(trigram, set())
+                candidates = postings if candidates is None else \
+                    candidates & postings
+                if not candidates:
+                    return []
+        if candidates is None:
+            # Only words shorter than three characters
+            candidates = range(len(self._texts))
+        matches = [
+            position for position in sorted(candidates)
+            if all(word in self._texts[position] for word in words)]
+        return sorted(matches, key=lambda position: not all(
+            word in self._titles[position] for word in words))
@@ -24,9 +24,15 @@ import sys
 import re
 import traceback
 
+import collections
 import datetime
+import functools
+import hashlib
+import itertools
 import json
-import requests
+import random
+import threading
+import time
 
 try:  # Python 3
     from urllib.parse import quote_plus, parse_qsl, ParseResult
@@ -36,19 +42,197 @@ except ImportError:  # Python 2
     from urlparse import parse_qsl, ParseResult
     from urlparse import urlparse as urlps
 
-from kodi_six import xbmc, xbmcgui, xbmcplugin, xbmcaddon
-from simplecache import SimpleCache
-import utils
-import youtube_channels
+try:  # Python 3
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+# Start of the import (without the standard library), see IMPORT_TIME.
+_MODULE_START = time.time()
+
+from kodi_six import xbmc, xbmcgui, xbmcplugin, xbmcaddon  # noqa: E402
+import showcatalog  # noqa: E402
+import utils  # noqa: E402
+
+# The modules requests, simplecache and youtube_channels are imported
+# on first use, since many routes do not need them.
 
 
 ADDON_ID = 'script.module.srgssr'
-REAL_SETTINGS = xbmcaddon.Addon(id=ADDON_ID)
-ADDON_NAME = REAL_SETTINGS.getAddonInfo('name')
-ADDON_VERSION = REAL_SETTINGS.getAddonInfo('version')
-ICON = REAL_SETTINGS.getAddonInfo('icon')
-LANGUAGE = REAL_SETTINGS.getLocalizedString
+_ADDON = []
+_ADDON_INFO = {}
+
+
+def get_addon():
+    """
+    Returns the xbmcaddon.Addon of this module. It is created on first
+    use, so that importing this module does not call into Kodi. It
+    replaces the former module constants REAL_SETTINGS, ADDON_NAME,
+    ADDON_VERSION and ICON (see also get_addon_info).
+    """
+    if not _ADDON:
+        _ADDON.append(xbmcaddon.Addon(id=ADDON_ID))
+    return _ADDON[0]
+
+
+def get_addon_info(key):
+    """
+    Returns an information about this module, like 'name', 'version' or
+    'icon' (see xbmcaddon.Addon.getAddonInfo).
+
+    Keyword arguments:
+    key  -- the key of the information
+    """
+    try:
+        return _ADDON_INFO[key]
+    except KeyError:
+        value = _ADDON_INFO[key] = get_addon().getAddonInfo(key)
+        return value
+
+
+# Localized strings of this module which were already looked up. The
+# snapshot is cleared when a SRGSSR instance is created, so it lasts for
+# one plugin invocation.
+_STRINGS = {}
+
+
+def LANGUAGE(string_id):
+    """
+    Returns a localized string of this module.
+
+    Keyword arguments:
+    string_id  -- the id of the string
+    """
+    try:
+        return _STRINGS[string_id]
+    except KeyError:
+        value = _STRINGS[string_id] = get_addon().getLocalizedString(
+            string_id)
+        return value
+
+
 TIMEOUT = 30
+# Time budget (in seconds) for importing this module and creating a
+# SRGSSR instance. A warning is logged if it is exceeded.
+STARTUP_BUDGET = 0.2
+
+# Cache policies for the responses of open_url. The first entry whose
+# pattern matches (re.search) the URL is used. A cached response is
+# considered fresh for `ttl`. After that, it is kept for `stale` to be
+# revalidated by a conditional request. Responses of URLs with
+# `cacheable` set to False are never cached. If the pattern contains a
+# group `date` (%d-%m-%Y) which lies in the past, `archive_ttl` is used
+# instead of `ttl`.
+CACHE_POLICIES = [
+    {
+        # Tokens for the streams
+        'pattern': r'^https?://tp\.srgssr\.ch/',
+        'cacheable': False,
+    }, {
+        # Live events
+        'pattern': r'^https?://event\.api\.swisstxt\.ch/',
+        'ttl': datetime.timedelta(minutes=1),
+        'stale': datetime.timedelta(minutes=10),
+        'cacheable': True,
+    }, {
+        'pattern': r'/integrationlayer/2\.0/.+/mediaComposition/',
+        'ttl': datetime.timedelta(hours=2),
+        'stale': datetime.timedelta(days=7),
+        'cacheable': True,
+    }, {
+        'pattern': r'/play/search/',
+        'ttl': datetime.timedelta(minutes=5),
+        'stale': datetime.timedelta(hours=1),
+        'cacheable': True,
+    }, {
+        'pattern': r'/latestEpisodes',
+        'ttl': datetime.timedelta(minutes=15),
+        'stale': datetime.timedelta(days=1),
+        'cacheable': True,
+    }, {
+        'pattern': r'/play/tv/programDay/(?P<date>\d{2}-\d{2}-\d{4})',
+        'ttl': datetime.timedelta(minutes=15),
+        'archive_ttl': datetime.timedelta(days=30),
+        'stale': datetime.timedelta(days=30),
+        'cacheable': True,
+    }, {
+        'pattern': r'/play/tv/topicList',
+        'ttl': datetime.timedelta(days=1),
+        'stale': datetime.timedelta(days=7),
+        'cacheable': True,
+    }, {
+        # Trending, newest, most clicked and soon offline lists
+        'pattern': (r'/(trending|latest|mostClicked|mostclicked|'
+                    r'soon-offline-videos)\b'),
+        'ttl': datetime.timedelta(minutes=10),
+        'stale': datetime.timedelta(hours=2),
+        'cacheable': True,
+    }
+]
+DEFAULT_CACHE_POLICY = {
+    'ttl': datetime.timedelta(hours=2),
+    'stale': datetime.timedelta(days=7),
+    'cacheable': True,
+}
+
+# Upper bound for the age of an expired response which is served in the
+# stale-while-revalidate mode.
+MAX_STALENESS = datetime.timedelta(days=1)
+# The scraped live event ids change quickly, they are cached only briefly.
+LIVE_TTL = datetime.timedelta(minutes=1)
+MAX_WORKERS = 8
+# Deadline (in seconds) for the first pages of all the favourite shows in
+# the newest favourites menu. A show which is slower is left out.
+FAVOURITES_TIMEOUT = 5
+JSON_MEMO_SIZE = 64
+STREAM_CHUNK_SIZE = 16 * 1024
+USER_AGENT = ('Mozilla/5.0 (X11; Linux x86_64; rv:59.0)'
+              'Gecko/20100101 Firefox/59.0')
+
+# The hosts which are contacted regularly. A connection pool is kept
+# for each of them.
+POOLED_HOSTS = (
+    'il.srgssr.ch',
+    'www.srf.ch',
+    'tp.srgssr.ch',
+    'event.api.swisstxt.ch',
+)
+
+# Connect and read timeouts (in seconds) per host. TIMEOUT is used as
+# read timeout for all the other hosts.
+HOST_TIMEOUTS = {
+    # The websites of the business units (see SRGSSR.host_url):
+    'www.srf.ch': (3, 10),
+    'www.rts.ch': (3, 10),
+    'www.rsi.ch': (3, 10),
+    'www.rtr.ch': (3, 10),
+    'play.swissinfo.ch': (3, 10),
+    'il.srgssr.ch': (5, 15),
+    'tp.srgssr.ch': (5, 10),
+    'event.api.swisstxt.ch': (5, 10),
+}
+CONNECT_TIMEOUT = 5
+
+# A download lock (see _acquire_url_lock) which is older than
+# LOCK_TIMEOUT seconds is considered to be left over by a plugin
+# invocation which was stopped by Kodi. Nobody waits longer than that.
+LOCK_TIMEOUT = 10
+
+# Failed requests (connection errors, timeouts and server errors) are
+# retried up to RETRIES times with a jittered exponential backoff.
+RETRIES = 2
+RETRY_BACKOFF = 0.5
+
+# If hedged requests are enabled, a second request is sent once the first
+# one takes longer than the given percentile (setting Hedge_Percentile,
+# HEDGE_PERCENTILE by default) of the latencies observed for the host (at
+# least HEDGE_MIN_SAMPLES samples are required). The last LATENCY_SAMPLES
+# latencies of every host are kept in the cache for LATENCY_TTL, so that
+# they are shared by the plugin invocations.
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 10
+LATENCY_SAMPLES = 50
+LATENCY_TTL = datetime.timedelta(days=7)
 
 IDREGEX = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+'
 
@@ -66,6 +250,25 @@ def get_params():
     return dict(parse_qsl(sys.argv[2][1:]))
 
 
+def directory_builder(method):
+    """
+    Decorator for the methods of SRGSSR which build (a part of) a
+    directory listing. The items added by such a method and by the
+    builders it calls are collected and handed over to Kodi in a single
+    call when the outermost builder returns.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.directory_depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.directory_depth -= 1
+            if not self.directory_depth:
+                self.flush_directory_items()
+    return wrapper
+
+
 class SRGSSR(object):
     """
     Base class for all SRG SSR related plugins.
@@ -73,15 +276,17 @@ class SRGSSR(object):
     (SRF, RTS, RSI, etc.) should be done here.
     """
     def __init__(self, plugin_handle, bu='srf', addon_id=ADDON_ID):
+        init_start = time.time()
         self.handle = plugin_handle
-        self.cache = SimpleCache()
-        self.real_settings = xbmcaddon.Addon(id=addon_id)
         self.bu = bu
         self.addon_id = addon_id
-        self.icon = self.real_settings.getAddonInfo('icon')
-        self.fanart = self.real_settings.getAddonInfo('fanart')
         self.language = LANGUAGE
-        self.plugin_language = self.real_settings.getLocalizedString
+        # Snapshots of the settings and the localized strings of the
+        # plugin, every value is read from Kodi only once per invocation
+        # (see get_setting and plugin_language):
+        self.settings_snapshot = {}
+        self.strings_snapshot = {}
+        _STRINGS.clear()
         self.host_url = 'https://www.%s.ch' % bu
         if bu == 'swi':
             self.host_url = 'https://play.swissinfo.ch'
@@ -90,18 +295,98 @@ class SRGSSR(object):
         self.media_uri = ('special://home/addons/%s/resources/'
                           'media') % self.addon_id
 
-        # Plugin options:
-        self.debug = self.get_boolean_setting(
-            'Enable_Debugging')
-        self.segments = self.get_boolean_setting(
-            'Enable_Show_Segments')
-        self.segments_topics = self.get_boolean_setting(
-            'Enable_Segments_Topics')
-        self.subtitles = self.get_boolean_setting(
-            'Extract_Subtitles')
-        self.prefer_hd = self.get_boolean_setting(
-            'Prefer_HD')
         self.number_of_episodes = 10
+        self.json_memo = utils.LRUCache(max_size=JSON_MEMO_SIZE)
+        self.inflight = {}
+        self.inflight_lock = threading.Lock()
+        self.latencies = {}
+        self.changed_latencies = set()
+        self.show_catalogs = {}
+        self.directory_items = []
+        self.directory_depth = 0
+
+        # Used by the background synchronisation (see catalogsync):
+        # If set, cached responses are revalidated even if they are fresh.
+        self.revalidate = False
+        self.request_count = 0
+        # If set, no more requests are sent once request_count reaches
+        # this number (see _request).
+        self.request_limit = None
+        # If set, no notifications are shown (e.g. in a background
+        # service).
+        self.quiet = False
+
+        # Messages which are logged with the next call of log (logging
+        # reads the settings, which is avoided during the startup):
+        self.pending_log = []
+        self.log_startup_time(init_start)
+
+    # The add-on, the settings, the cache and the HTTP session are only
+    # created when they are used for the first time:
+    real_settings = utils.lazy_property(
+        lambda self: xbmcaddon.Addon(id=self.addon_id))
+    icon = utils.lazy_property(
+        lambda self: self.real_settings.getAddonInfo('icon'))
+    fanart = utils.lazy_property(
+        lambda self: self.real_settings.getAddonInfo('fanart'))
+
+    # Plugin options:
+    debug = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Enable_Debugging'))
+    segments = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Enable_Show_Segments'))
+    segments_topics = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Enable_Segments_Topics'))
+    subtitles = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Extract_Subtitles'))
+    prefer_hd = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Prefer_HD'))
+    stale_while_revalidate = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Stale_While_Revalidate'))
+    hedged_requests = utils.lazy_property(
+        lambda self: self.get_boolean_setting('Hedged_Requests'))
+    hedge_percentile = utils.lazy_property(
+        lambda self: min(max(self.get_integer_setting(
+            'Hedge_Percentile', default=HEDGE_PERCENTILE), 1), 100))
+    max_workers = utils.lazy_property(
+        lambda self: self.get_integer_setting(
+            'Number_Of_Workers', default=MAX_WORKERS))
+
+    @utils.lazy_property
+    def cache(self):
+        """
+        The SimpleCache of the add-on.
+        """
+        from simplecache import SimpleCache
+        return SimpleCache()
+
+    @utils.lazy_property
+    def session(self):
+        """
+        The HTTP session (see create_session).
+        """
+        return self.create_session()
+
+    def log_startup_time(self, init_start):
+        """
+        Logs the time needed to import this module and to create this
+        instance, together with the route of the plugin invocation.
+        A warning is logged if the STARTUP_BUDGET is exceeded. The message
+        is only written with the next message of the plugin, so that
+        neither the add-on nor its settings are read during the startup.
+
+        Keyword arguments:
+        init_start  -- the time when the creation of the instance started
+        """
+        import_time = IMPORT_TIME
+        init_time = time.time() - init_start
+        route = sys.argv[2] if len(sys.argv) > 2 else ''
+        level = xbmc.LOGDEBUG
+        if import_time + init_time > STARTUP_BUDGET:
+            level = xbmc.LOGWARNING
+        self.pending_log.append((
+            'startup: import %.1f ms, init %.1f ms, route = %s' % (
+                import_time * 1000, init_time * 1000, route), level))
 
     def get_youtube_icon(self):
         path = os.path.join(
@@ -110,6 +395,21 @@ class SRGSSR(object):
             return path
         return self.icon
 
+    def get_setting(self, setting):
+        """
+        Returns the value (a string) of a specified setting. The value is
+        read from Kodi only on the first call.
+
+        Keyword arguments
+        setting  -- the setting option to read
+        """
+        try:
+            return self.settings_snapshot[setting]
+        except KeyError:
+            value = self.settings_snapshot[setting] = \
+                self.real_settings.getSetting(setting)
+            return value
+
     def get_boolean_setting(self, setting):
         """
         Returns the boolean value of a specified setting.
@@ -117,7 +417,86 @@ class SRGSSR(object):
         Keyword arguments
         setting  -- the setting option to check
         """
-        return self.real_settings.getSetting(setting) == 'true'
+        return self.get_setting(setting) == 'true'
+
+    def plugin_language(self, string_id):
+        """
+        Returns a localized string of the plugin. The string is read from
+        Kodi only on the first call.
+
+        Keyword arguments:
+        string_id  -- the id of the string
+        """
+        try:
+            return self.strings_snapshot[string_id]
+        except KeyError:
+            value = self.strings_snapshot[string_id] = \
+                self.real_settings.getLocalizedString(string_id)
+            return value
+
+    def create_session(self):
+        """
+        Creates a HTTP session which keeps the connections to the
+        frequently used hosts alive. Every host gets its own pool which
+        is large enough for all the worker threads.
+        """
+        import requests
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=len(POOLED_HOSTS) + 1,
+            pool_maxsize=max(self.max_workers, 1))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Connection': 'keep-alive',
+        })
+        return session
+
+    def add_directory_item(self, url, list_item, is_folder=False):
+        """
+        Adds an item to the directory listing. Within a directory builder
+        (see directory_builder) the item is only collected, otherwise it
+        is added immediately.
+
+        Keyword arguments:
+        url        -- the plugin URL of the item
+        list_item  -- the xbmcgui.ListItem
+        is_folder  -- whether the item is a folder (default: False)
+        """
+        if self.directory_depth:
+            self.directory_items.append((url, list_item, is_folder))
+        else:
+            xbmcplugin.addDirectoryItem(
+                self.handle, url, list_item, isFolder=is_folder)
+
+    def flush_directory_items(self):
+        """
+        Adds all the collected items to the directory listing at once.
+        """
+        items = self.directory_items
+        self.directory_items = []
+        if items:
+            xbmcplugin.addDirectoryItems(
+                self.handle, items, totalItems=len(items))
+        # The listing is complete, this is the end of the invocation:
+        self.save_latencies()
+
+    def get_integer_setting(self, setting, default=0):
+        """
+        Returns the integer value of a specified setting. If the setting
+        is not available (or not a valid integer), the default value
+        will be returned.
+
+        Keyword arguments
+        setting  -- the setting option to read
+        default  -- the value to return if the setting is not
+                    available (default: 0)
+        """
+        try:
+            return int(self.get_setting(setting))
+        except (TypeError, ValueError):
+            return default
 
     def log(self, msg, level=xbmc.LOGDEBUG):
         """
@@ -127,10 +506,14 @@ class SRGSSR(object):
         msg   -- the message to log
         level -- the logging level
         """
+        if self.pending_log:
+            pending, self.pending_log = self.pending_log, []
+            for pending_msg, pending_level in pending:
+                self.log(pending_msg, level=pending_level)
         if self.debug:
             if level == xbmc.LOGERROR:
                 msg += ' ,' + traceback.format_exc()
-        message = ADDON_ID + '-' + ADDON_VERSION + '-' + msg
+        message = ADDON_ID + '-' + get_addon_info('version') + '-' + msg
         xbmc.log(msg=message, level=level)
 
     @staticmethod
@@ -160,37 +543,489 @@ class SRGSSR(object):
                 added = True
         return purl
 
-    def open_url(self, url, use_cache=True):
+    def open_url(self, url, use_cache=True, allow_stale=False):
         """Open and read the content given by a URL.
 
+        The responses are stored in the cache together with their
+        validators (ETag and Last-Modified). Once a cached response is
+        expired, it is revalidated with a conditional request, so that
+        unchanged content does not have to be downloaded again.
+
+        If the stale-while-revalidate mode is enabled and `allow_stale`
+        is set, an expired response (not older than MAX_STALENESS) is
+        returned immediately and refreshed in a background thread.
+
         Keyword arguments:
-        url       -- the URL to open as a string
-        use_cache -- boolean to indicate if the cache provided by the
-                     Kodi module SimpleCache should be used (default: True)
+        url         -- the URL to open as a string
+        use_cache   -- boolean to indicate if the cache provided by the
+                       Kodi module SimpleCache should be used
+                       (default: True)
+        allow_stale -- boolean to indicate if an expired response may be
+                       returned while it is refreshed (default: False)
         """
         self.log('open_url, url = ' + str(url))
-        cache_response = None
-        if use_cache:
-            cache_response = self.cache.get(
-                ADDON_NAME + '.open_url, url = %s' % url)
-        if not cache_response:
-            headers = {
-                'User-Agent': ('Mozilla/5.0 (X11; Linux x86_64; rv:59.0)'
-                               'Gecko/20100101 Firefox/59.0'),
-            }
-            response = requests.get(url, headers=headers)
-            if not response.ok:
-                self.log('open_url: Failed to open url %s' % url)
-                xbmcgui.Dialog().notification(
-                    ADDON_NAME, LANGUAGE(30100), ICON, 4000)
-                return ''
+        cache_id = get_addon_info('name') + '.open_url, url = %s' % url
+        return self._open_cached(
+            url, cache_id, lambda response: response.text, lambda: '',
+            use_cache=use_cache, allow_stale=allow_stale)
+
+    def _open_cached(self, url, cache_id, convert, default, use_cache=True,
+                     allow_stale=False, ttl=None, stream=False):
+        """
+        Opens a URL and returns its content converted by a given function.
+        Only the converted value is cached (see open_url for the
+        revalidation and the stale-while-revalidate mode). Concurrent
+        calls for the same cache identifier are coalesced: Only the first
+        caller opens the URL, the others wait for its result.
+
+        Keyword arguments:
+        url         -- the URL to open as a string
+        cache_id    -- the cache identifier of the value
+        convert     -- a function taking the response and returning the
+                       value; empty values are not cached
+        default     -- a function (without arguments) returning the value
+                       to return if the URL cannot be opened and nothing
+                       is cached
+        use_cache   -- see open_url (default: True)
+        allow_stale -- see open_url (default: False)
+        ttl         -- a datetime.timedelta overriding the time to live of
+                       the cache policy (default: None)
+        stream      -- see _request (default: False)
+        """
+        with self.inflight_lock:
+            flight = self.inflight.get(cache_id)
+            leader = flight is None
+            if leader:
+                flight = {'event': threading.Event()}
+                self.inflight[cache_id] = flight
+        if not leader:
+            self.log('_open_cached: Waiting for in-flight request, '
+                     'url = %s' % url)
+            flight['event'].wait()
+            if 'result' not in flight:
+                # The first caller failed
+                return default()
+            return flight['result']
+        try:
+            flight['result'] = self._read_cached(
+                url, cache_id, convert, default, use_cache, allow_stale,
+                ttl, stream)
+        finally:
+            with self.inflight_lock:
+                del self.inflight[cache_id]
+            flight['event'].set()
+        return flight['result']
+
+    def _read_cached(self, url, cache_id, convert, default, use_cache,
+                     allow_stale, ttl, stream):
+        """
+        Implements _open_cached (without the coalescing of concurrent
+        requests in the same process).
+
+        Keyword arguments:
+        see _open_cached
+        """
+        policy_ttl, stale, cacheable = self.get_cache_policy(url)
+        ttl = policy_ttl if ttl is None else ttl
+        use_cache = use_cache and cacheable
+        entry = self.cache.get(cache_id) if use_cache else None
+        if not isinstance(entry, dict) or 'value' not in entry:
+            # Not cached or written by a previous version
+            entry = None
+        if entry:
+            age = time.time() - entry.get('expires', 0)
+            if age < 0 and not self.revalidate:
+                return entry['value']
+            if allow_stale and self.stale_while_revalidate and \
+                    age < min(stale, MAX_STALENESS).total_seconds():
+                self.log('_read_cached: Serving stale value, url = %s' % url)
+                thread = threading.Thread(
+                    target=self._fetch_cached,
+                    args=(url, cache_id, entry, convert, default, ttl,
+                          stale, cacheable),
+                    kwargs={'stream': stream, 'notify': False})
+                thread.start()
+                return entry['value']
+        if not use_cache:
+            return self._fetch_cached(
+                url, cache_id, entry, convert, default, ttl, stale,
+                cacheable, stream=stream)
+
+        # Another plugin process may be downloading the same URL. In this
+        # case we wait for it and use its result from the cache.
+        lock_path, waited = self._acquire_url_lock(cache_id)
+        try:
+            if waited:
+                entry = self.cache.get(cache_id)
+                if not isinstance(entry, dict) or 'value' not in entry:
+                    entry = None
+                elif entry.get('expires', 0) > time.time():
+                    return entry['value']
+            return self._fetch_cached(
+                url, cache_id, entry, convert, default, ttl, stale,
+                cacheable, stream=stream)
+        finally:
+            self._release_url_lock(lock_path)
+
+    def _request(self, url, headers, stream=False):
+        """
+        Sends a GET request and returns the response, or None if no
+        response could be received (or the request_limit is reached).
+        Connection errors, timeouts and server errors are retried with a
+        jittered exponential backoff.
+
+        Keyword arguments:
+        url      -- the URL to request
+        headers  -- a dictionary of additional headers
+        stream   -- if set, the body of the response is not downloaded
+                    in advance (default: False)
+        """
+        import requests
+        host = urlps(url).netloc
+        timeout = HOST_TIMEOUTS.get(host, (CONNECT_TIMEOUT, TIMEOUT))
+        response = None
+        for attempt in range(RETRIES + 1):
+            if self.request_limit is not None and \
+                    self.request_count >= self.request_limit:
+                self.log('_request: Request limit reached, skipping %s' %
+                         url)
+                return None
+            if attempt:
+                delay = random.uniform(0, RETRY_BACKOFF * 2 ** attempt)
+                self.log('_request: Retrying %s in %.2f seconds' % (
+                    url, delay))
+                time.sleep(delay)
+            self.request_count += 1
+            try:
+                response = self._hedged_get(
+                    url, headers, timeout, host, stream=stream)
+            except requests.exceptions.RequestException as exc:
+                self.log('_request: Request for %s failed: %s' % (url, exc))
+                response = None
+                continue
+            if response.status_code < 500:
+                return response
+        return response
+
+    def _hedged_get(self, url, headers, timeout, host, stream=False):
+        """
+        Sends a GET request. If hedged requests are enabled and the
+        request takes longer than usual for the host (see
+        HEDGE_PERCENTILE), a second identical request is sent and the
+        response which arrives first is returned. Streamed requests
+        are never hedged.
+
+        Keyword arguments:
+        url      -- the URL to request
+        headers  -- a dictionary of additional headers
+        timeout  -- a tuple (connect timeout, read timeout)
+        host     -- the host of the URL
+        stream   -- see _request (default: False)
+        """
+        import requests
+
+        def get():
+            start = time.time()
+            response = self.session.get(
+                url, headers=headers, timeout=timeout, stream=stream)
+            if not stream:
+                self._record_latency(host, time.time() - start)
+            return response
+
+        delay = self._hedge_delay(host)
+        if delay is None or stream:
+            return get()
+
+        results = queue.Queue()
+
+        def worker():
+            try:
+                results.put((get(), None))
+            except requests.exceptions.RequestException as exc:
+                results.put((None, exc))
+
+        threads = [threading.Thread(target=worker)]
+        threads[0].daemon = True
+        threads[0].start()
+        try:
+            response, exc = results.get(timeout=delay)
+        except queue.Empty:
+            self.log('_hedged_get: Sending hedged request for %s' % url)
+            threads.append(threading.Thread(target=worker))
+            threads[1].daemon = True
+            threads[1].start()
+            response, exc = results.get()
+            if exc is not None:
+                # The other request may still succeed
+                response, exc = results.get()
+        if exc is not None:
+            raise exc
+        return response
+
+    def _hedge_delay(self, host):
+        """
+        Returns the time (in seconds) after which a hedged request for
+        a host is sent, or None if no hedged request should be sent.
+
+        Keyword arguments:
+        host  -- the host
+        """
+        if not self.hedged_requests:
+            return None
+        samples = sorted(self._latency_samples(host))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        index = int(self.hedge_percentile / 100.0 * (len(samples) - 1))
+        return samples[index]
+
+    def _latency_samples(self, host):
+        """
+        Returns the latencies (a deque of at most LATENCY_SAMPLES
+        seconds) observed for a host. The samples of former plugin
+        invocations are read from the cache on the first call.
+
+        Keyword arguments:
+        host  -- the host
+        """
+        try:
+            return self.latencies[host]
+        except KeyError:
+            cached = self.cache.get(
+                ADDON_ID + '.latencies, host = %s' % host)
+            return self.latencies.setdefault(host, collections.deque(
+                cached if isinstance(cached, list) else [],
+                maxlen=LATENCY_SAMPLES))
+
+    def _record_latency(self, host, latency):
+        """
+        Adds a latency to the samples of a host. The samples are stored
+        in the cache by save_latencies. Nothing is recorded if hedged
+        requests are disabled.
+
+        Keyword arguments:
+        host     -- the host
+        latency  -- the latency in seconds
+        """
+        if not self.hedged_requests:
+            return
+        self._latency_samples(host).append(latency)
+        self.changed_latencies.add(host)
+
+    def save_latencies(self):
+        """
+        Stores the latency samples of the hosts which were requested since
+        the last call in the cache, so that the next plugin invocations
+        can use them (see _hedge_delay).
+        """
+        hosts = self.changed_latencies
+        self.changed_latencies = set()
+        for host in hosts:
             self.cache.set(
-                ADDON_NAME + '.open_url, url = %s' % url,
-                response.text,
-                expiration=datetime.timedelta(hours=2))
-            return response.text
-        return self.cache.get(ADDON_NAME + '.open_url, url = %s' % url)
+                ADDON_ID + '.latencies, host = %s' % host,
+                list(self.latencies[host]), expiration=LATENCY_TTL)
 
+    def _acquire_url_lock(self, key):
+        """
+        Acquires a file lock for the download of a URL which is shared by
+        all the plugin processes. Returns a tuple (path, waited), where
+        path is the path of the lock file (None if the lock could not be
+        created) and waited indicates if another process held the lock
+        before.
+
+        Keyword arguments:
+        key  -- the cache identifier of the downloaded value
+        """
+        lock_dir = os.path.join(xbmc.translatePath(
+            self.real_settings.getAddonInfo('profile')), 'locks')
+        name = hashlib.md5(key.encode('utf-8')).hexdigest()
+        path = os.path.join(lock_dir, name + '.lock')
+        waited = False
+        deadline = time.time() + LOCK_TIMEOUT
+        while True:
+            try:
+                if not os.path.exists(lock_dir):
+                    os.makedirs(lock_dir)
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return path, waited
+            except OSError:
+                pass
+            if time.time() > deadline:
+                return None, waited
+            try:
+                if time.time() - os.path.getmtime(path) > LOCK_TIMEOUT:
+                    # The holder is gone (or too slow), take the lock over
+                    os.remove(path)
+                    continue
+                waited = True
+            except OSError:
+                pass
+            time.sleep(0.1)
+
+    @staticmethod
+    def _release_url_lock(path):
+        """
+        Releases a file lock acquired by _acquire_url_lock.
+
+        Keyword arguments:
+        path  -- the path of the lock file (or None)
+        """
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _fetch_cached(self, url, cache_id, entry, convert, default, ttl,
+                      stale, cacheable, stream=False, notify=True):
+        """
+        Downloads the content given by a URL (by a conditional request if
+        a cached entry is provided), converts it and updates the cache.
+        If the content was not modified, the cached entry is extended.
+        If the URL cannot be opened or the converted value is empty (or
+        None), the cached value (if any) is returned. A notification is
+        only shown if the URL cannot be opened.
+
+        Keyword arguments:
+        url       -- the URL to open as a string
+        cache_id  -- the cache identifier of the value
+        entry     -- the cached entry or None
+        convert   -- see _open_cached
+        default   -- see _open_cached
+        ttl       -- see get_cache_policy
+        stale     -- see get_cache_policy
+        cacheable -- see get_cache_policy
+        stream    -- see _request (default: False)
+        notify    -- show a notification in case of failure (default: True)
+        """
+        import requests
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        response = self._request(url, headers, stream=stream)
+        if entry and response is not None and response.status_code == 304:
+            self.log('_fetch_cached: Not modified, url = %s' % url)
+            response.close()
+            entry['expires'] = time.time() + ttl.total_seconds()
+            self.cache.set(cache_id, entry, expiration=ttl + stale)
+            return entry['value']
+        value = None
+        failed = response is None or not response.ok
+        if not failed:
+            try:
+                value = convert(response)
+            except requests.exceptions.RequestException as exc:
+                self.log('_fetch_cached: Download of %s failed: %s' % (
+                    url, exc))
+                failed = True
+            finally:
+                response.close()
+        if failed:
+            self.log('_fetch_cached: Failed to open url %s' % url)
+            if entry:
+                return entry['value']
+            if notify and not self.quiet:
+                xbmcgui.Dialog().notification(
+                    get_addon_info('name'), LANGUAGE(30100),
+                    get_addon_info('icon'), 4000)
+            return default()
+        if not value:
+            # Empty values are not cached, the content might be broken
+            # only temporarily.
+            self.log('_fetch_cached: No content, url = %s' % url)
+            return entry['value'] if entry else value
+        if cacheable:
+            self.cache.set(cache_id, {
+                'value': value,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'expires': time.time() + ttl.total_seconds(),
+            }, expiration=ttl + stale)
+        return value
+
+    def extract_from_url(self, url, name, extractor, use_cache=True,
+                         ttl=None):
+        """
+        Opens a URL and returns the result of an extractor applied to its
+        content. Only the result is cached (keyed by the URL and the name
+        of the extractor), not the content itself, so a cache hit neither
+        decodes nor scans the webpage again. An expired result is
+        revalidated with a conditional request (see _open_cached).
+
+        Keyword arguments:
+        url        -- the URL to open as a string
+        name       -- a name identifying the extractor (and its
+                      arguments)
+        extractor  -- a function taking the content of the URL (an empty
+                      string if the URL could not be opened) and returning
+                      the extracted data
+        use_cache  -- see open_url (default: True)
+        ttl        -- a datetime.timedelta overriding the time to live of
+                      the cache policy (default: None)
+        """
+        cache_id = get_addon_info('name') + (
+            '.extract_from_url, url = %s, name = %s' % (url, name))
+        return self._open_cached(
+            url, cache_id, lambda response: extractor(response.text),
+            lambda: extractor(''), use_cache=use_cache, ttl=ttl)
+
+    def get_json(self, url, use_cache=True, allow_stale=False):
+        """
+        Opens a URL (see open_url) and returns the decoded JSON content.
+        The decoded objects are kept in memory, so that repeated requests
+        for the same URL during one plugin invocation neither hit the
+        cache nor decode the content again. The returned objects are
+        shared and must not be modified. A ValueError will be raised if
+        the content cannot be decoded.
+
+        Keyword arguments:
+        url         -- the URL to open as a string
+        use_cache   -- see open_url (default: True)
+        allow_stale -- see open_url (default: False)
+        """
+        if use_cache:
+            data = self.json_memo.get(url)
+            if data is not None:
+                return data
+        data = json.loads(
+            self.open_url(url, use_cache=use_cache, allow_stale=allow_stale))
+        if use_cache:
+            self.json_memo.set(url, data)
+        return data
+
+    @staticmethod
+    def get_cache_policy(url):
+        """
+        Returns the cache policy for a given URL as a tuple
+        (ttl, stale, cacheable), see CACHE_POLICIES.
+
+        Keyword arguments:
+        url  -- the URL to look up
+        """
+        policy = DEFAULT_CACHE_POLICY
+        match = None
+        for candidate in CACHE_POLICIES:
+            match = re.search(candidate['pattern'], url)
+            if match:
+                policy = candidate
+                break
+        if not policy['cacheable']:
+            return datetime.timedelta(0), datetime.timedelta(0), False
+        ttl = policy['ttl']
+        if match and 'archive_ttl' in policy and \
+                match.groupdict().get('date'):
+            try:
+                day, month, year = match.group('date').split('-')
+                date = datetime.date(int(year), int(month), int(day))
+                if date < datetime.date.today():
+                    ttl = policy['archive_ttl']
+            except ValueError:
+                pass
+        return ttl, policy['stale'], True
+
+    @directory_builder
     def build_main_menu(self, identifiers=[]):
         """
         Builds the main menu of the plugin:
@@ -332,6 +1167,7 @@ class SRGSSR(object):
                 folders.append(item)
         self.build_folder_menu(folders)
 
+    @directory_builder
     def build_folder_menu(self, folders):
         """
         Builds a menu from a list of folder dictionaries. Each dictionary
@@ -348,30 +1184,72 @@ class SRGSSR(object):
                 uname = purl_dict.get('name') or item.get('identifier')
                 purl = self.build_url(
                     mode=mode, name=uname)
-                xbmcplugin.addDirectoryItem(
-                    handle=self.handle, url=purl,
-                    listitem=list_item, isFolder=True)
+                self.add_directory_item(purl, list_item, is_folder=True)
 
-    # TODO: Check, if this can be replaced by extract_shows_information,
-    # like it is already done for radio shows.
-    def read_all_available_shows(self):
+    def get_all_shows_catalog(self):
         """
-        Downloads a list of all available shows and returns this list.
+        Returns a ShowCatalog of all the available shows
+        (see read_all_shows_records).
+        """
+        catalog = self.show_catalogs.get('all')
+        if catalog is None:
+            catalog = showcatalog.ShowCatalog(
+                self.read_all_shows_records(allow_stale=True))
+            self.show_catalogs['all'] = catalog
+        return catalog
+
+    def read_all_shows_records(self, allow_stale=False):
+        """
+        Returns the list of all available shows, every show is reduced to
+        a show dictionary of the ShowCatalog. The response is parsed while
+        it is downloaded, and only the reduced list is cached, so the
+        memory usage does not depend on the size of the raw document.
 
         This works for the business units 'srf', 'rts', 'rsi' and 'rtr', but
         not for 'swi'.
+
+        Keyword arguments:
+        allow_stale -- see open_url (default: False)
         """
         json_url = ('http://il.srgssr.ch/integrationlayer/1.0/ue/%s/tv/'
                     'assetGroup/editorialPlayerAlphabetical.json') % self.bu
-        json_response = json.loads(self.open_url(json_url))
-        show_list = utils.try_get(
-            json_response,
-            ('AssetGroups', 'Show'), data_type=list, default=[])
-        if not show_list:
-            self.log('read_all_available_shows: No shows found.')
-            return []
-        return show_list
 
+        def convert(response):
+            return [
+                show for show in (
+                    showcatalog.ShowCatalog.normalize_asset_group_show(jse)
+                    for jse in utils.iter_json_array(
+                        response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                        'Show'))
+                if show]
+
+        shows = self._open_cached(
+            json_url, self.addon_id + '.all_shows_records', convert, list,
+            allow_stale=allow_stale, stream=True)
+        if not shows:
+            self.log('read_all_shows_records: No shows found.')
+        return shows
+
+    def get_show_catalog(self, radio_tv, channel_id=None):
+        """
+        Returns a ShowCatalog of the featured shows
+        (see extract_shows_information).
+
+        Keyword arguments:
+        radio_tv    -- either 'radio' for radio shows or 'tv' for tv shows
+        channel_id  -- a channel id, if it is desired to get the shows
+                       of a given channel, otherwise use None
+                       (default: None)
+        """
+        key = (radio_tv, channel_id)
+        catalog = self.show_catalogs.get(key)
+        if catalog is None:
+            catalog = showcatalog.ShowCatalog(self.extract_shows_information(
+                radio_tv, channel_id=channel_id) or [])
+            self.show_catalogs[key] = catalog
+        return catalog
+
+    @directory_builder
     def build_all_shows_menu(self, favids=None):
         """
         Builds a list of folders containing the names of all the current
@@ -383,43 +1261,28 @@ class SRGSSR(object):
                   the shows on that list will be build. (default: None)
         """
         self.log('build_all_shows_menu')
-        show_list = self.read_all_available_shows()
-
-        list_items = []
-        for jse in show_list:
-            title = utils.try_get(jse, 'title')
-            show_id = utils.try_get(jse, 'id')
-            if not (title and show_id):
-                self.log(
-                    'build_all_shows_menu: Skipping, no title or id found.')
-                continue
+        catalog = self.get_all_shows_catalog()
 
-            # Skip if we build the 'favourite show menu' and the current
-            # show id is not in our favourites:
-            if favids is not None and show_id not in favids:
-                continue
+        # If we build the 'favourite show menu', only the shows in our
+        # favourites are taken:
+        shows = catalog if favids is None else catalog.select(favids)
 
+        for show in shows:
+            title = show['title']
             list_item = xbmcgui.ListItem(label=title)
             list_item.setProperty('IsPlayable', 'false')
             list_item.setInfo(
                 'video',
                 {
                     'title': title,
-                    'plot': utils.try_get(
-                        jse, 'lead') or utils.try_get(jse, 'description'),
+                    'plot': show['lead'] or show['description'],
                 }
             )
 
-            image_url = utils.try_get(
-                jse,
-                ('Image', 'ImageRepresentations',
-                 'ImageRepresentation', 0, 'url'))
+            image_url = show['imageUrl']
             if image_url:
-                image_url = re.sub(r'/\d+x\d+', '', image_url)
                 thumbnail = image_url + '/scale/width/688'
-                banner = image_url.replace(
-                    'WEBVISUAL',
-                    'HEADER_SRF_PLAYER')
+                banner = show['bannerImageUrl']
             else:
                 image_url = self.fanart
                 thumbnail = self.icon
@@ -430,11 +1293,10 @@ class SRGSSR(object):
                 'poster': image_url,
                 'banner': banner,
             })
-            url = self.build_url(mode=20, name=show_id)
-            list_items.append((url, list_item, True))
-        xbmcplugin.addDirectoryItems(
-            self.handle, list_items, totalItems=len(list_items))
+            url = self.build_url(mode=20, name=show['id'])
+            self.add_directory_item(url, list_item, is_folder=True)
 
+    @directory_builder
     def build_favourite_shows_menu(self):
         """
         Builds a list of folders for the favourite shows.
@@ -443,6 +1305,7 @@ class SRGSSR(object):
         favourite_show_ids = self.read_favourite_show_ids()
         self.build_all_shows_menu(favids=favourite_show_ids)
 
+    @directory_builder
     def build_show_folder(self, show_id, radio_tv):
         """
         Creates a folder for a specified show.
@@ -457,7 +1320,7 @@ class SRGSSR(object):
             return
         query_url = '%s/play/%s/show/%s/latestEpisodes' % (
             self.host_url, radio_tv, show_id)
-        result = json.loads(self.open_url(query_url, use_cache=True))
+        result = self.get_json(query_url, use_cache=True)
         show_info = utils.try_get(result, 'show', data_type=dict, default={})
         if not show_info:
             self.log('build_show_folder: Unable to retrieve show info')
@@ -486,12 +1349,18 @@ class SRGSSR(object):
             'banner': banner_image
         })
         url = self.build_url(mode=20, name=show_id)
-        xbmcplugin.addDirectoryItem(self.handle, url, list_item, isFolder=True)
+        self.add_directory_item(url, list_item, is_folder=True)
 
+    @directory_builder
     def build_newest_favourite_menu(self, page=1, audio=False):
         """
         Builds a Kodi list of the newest favourite shows.
 
+        The episodes of every show are ordered from newest to oldest, so
+        they are merged lazily: Only the first page of every show is
+        requested in advance, further pages of a show are only requested
+        when the merge needs older episodes of that show.
+
         Keyword arguments:
         page -- an integer indicating the current page on the
                 list (default: 1)
@@ -502,57 +1371,102 @@ class SRGSSR(object):
 
         # TODO: This depends on the local time settings
         now = datetime.datetime.now()
+        min_key = utils.datetime_sort_key(
+            now + datetime.timedelta(-number_of_days))
         current_month_date = datetime.date.today().strftime('%m-%Y')
-        list_of_episodes_dict = []
         banners = {}
         section = 'radio' if audio else 'tv'
-        for sid in show_ids:
-            json_url = ('%s/play/%s/show/%s/latestEpisodes?numberOfEpisodes=%d'
-                        '&tillMonth=%s') % (self.host_url, section, sid,
-                                            number_of_days, current_month_date)
-            self.log('build_newest_favourite_menu. Open URL %s.' % json_url)
-            response = json.loads(self.open_url(json_url))
-            banner_image = utils.try_get(
-                response,
-                ('show', 'bannerImageUrl'))
-            if re.match(r'.+/\d+x\d+$', banner_image):
-                banner_image += '/scale/width/1000'
-
-            episode_list = utils.try_get(
-                response, 'episodes', data_type=list, default=[])
-            for episode in episode_list:
-                date_time = utils.parse_datetime(
-                    utils.try_get(episode, 'date'))
-                if date_time and \
-                        date_time >= now + datetime.timedelta(-number_of_days):
-                    list_of_episodes_dict.append(episode)
-                    banners.update(
-                        {utils.try_get(episode, 'id'): banner_image})
-        sorted_list_of_episodes_dict = sorted(
-            list_of_episodes_dict, key=lambda k: utils.parse_datetime(
-                utils.try_get(k, 'date')), reverse=True)
         try:
             page = int(page)
         except TypeError:
             page = 1
-        reduced_list = sorted_list_of_episodes_dict[
-            (page - 1)*self.number_of_episodes:page*self.number_of_episodes]
-        for episode in reduced_list:
+
+        def read_latest_episodes(sid, page_hash=None):
+            if page_hash:
+                json_url = ('%s/play/%s/show/%s/latestEpisodes?'
+                            'nextPageHash=%s&tillMonth=%s') % (
+                                self.host_url, section, sid, page_hash,
+                                current_month_date)
+            else:
+                json_url = ('%s/play/%s/show/%s/latestEpisodes?'
+                            'numberOfEpisodes=%d&tillMonth=%s') % (
+                                self.host_url, section, sid,
+                                self.number_of_episodes, current_month_date)
+            self.log('build_newest_favourite_menu. Open URL %s.' % json_url)
+            return self.get_json(json_url)
+
+        def keyed_episodes(sid, response):
+            banner_image = utils.try_get(response, ('show', 'bannerImageUrl'))
+            if re.match(r'.+/\d+x\d+$', banner_image):
+                banner_image += '/scale/width/1000'
+            page_hash = None
+            while True:
+                episode_list = utils.try_get(
+                    response, 'episodes', data_type=list, default=[])
+                for episode in episode_list:
+                    date_time = utils.parse_datetime(
+                        utils.try_get(episode, 'date'))
+                    if not date_time:
+                        continue
+                    key = utils.datetime_sort_key(date_time)
+                    if key < min_key:
+                        return
+                    banners[utils.try_get(episode, 'id')] = banner_image
+                    yield key, episode
+                next_page_hash = self.extract_next_page_hash(response)
+                if not next_page_hash or next_page_hash == page_hash:
+                    return
+                page_hash = next_page_hash
+                try:
+                    response = read_latest_episodes(sid, page_hash)
+                except ValueError:
+                    return
+
+        # The first pages of all the shows are requested concurrently.
+        # A show which fails or does not answer in time is left out.
+        # The streams are kept in the order of show_ids, so that episodes
+        # with the same date are always listed in the same order.
+        responses = utils.parallel_map(
+            read_latest_episodes, show_ids, max_workers=self.max_workers,
+            timeout=FAVOURITES_TIMEOUT)
+        streams = [
+            keyed_episodes(sid, response)
+            for sid, response in zip(show_ids, responses)
+            if response is not None]
+
+        end = page * self.number_of_episodes
+        # One additional item to know whether there is a next page:
+        head = [episode for _, episode in itertools.islice(
+            utils.merge_descending(streams), end + 1)]
+        for episode in head[end - self.number_of_episodes:end]:
             segments = utils.try_get(
                 episode, 'segments', data_type=list, default=[])
             is_folder = True if segments and self.segments else False
             self.build_entry(
-                episode, banner=utils.try_get(episode, 'id'),
+                episode, banner=banners.get(utils.try_get(episode, 'id')),
                 is_folder=is_folder, audio=audio)
 
-        if len(sorted_list_of_episodes_dict) > page * self.number_of_episodes:
+        if len(head) > end:
             next_item = xbmcgui.ListItem(
                 label='>> ' + LANGUAGE(30073))  # Next page
             next_item.setProperty('IsPlayable', 'false')
             purl = self.build_url(mode=12, page=page+1)
-            xbmcplugin.addDirectoryItem(
-                self.handle, purl, next_item, isFolder=True)
+            self.add_directory_item(purl, next_item, is_folder=True)
+
+    @staticmethod
+    def extract_next_page_hash(json_response):
+        """
+        Extracts the hash of the next page from a response of the
+        latestEpisodes API. Returns None if there is no next page.
+
+        Keyword arguments:
+        json_response  -- the decoded response
+        """
+        next_page_url = utils.try_get(json_response, 'nextPageUrl')
+        match = re.search(r'nextPageHash=(?P<hash>[0-9a-f]+)', next_page_url)
+        return match.group('hash') if match else None
 
+    @directory_builder
     def build_show_menu(self, show_id, page_hash=None, audio=False):
         """
         Builds a list of videos (can be folders in case of segmented videos)
@@ -580,7 +1494,7 @@ class SRGSSR(object):
                         '&tillMonth=%s') % (self.host_url, section, show_id,
                                             page_hash, current_month_date)
 
-        json_response = json.loads(self.open_url(json_url))
+        json_response = self.get_json(json_url, allow_stale=True)
         try:
             banner_image = utils.try_get(
                 json_response, ('show', 'bannerImageUrl'))
@@ -592,13 +1506,7 @@ class SRGSSR(object):
         except KeyError:
             banner_image = None
 
-        next_page_hash = None
-        if 'nextPageUrl' in json_response:
-            next_page_url = utils.try_get(json_response, 'nextPageUrl')
-            next_page_hash_regex = r'nextPageHash=(?P<hash>[0-9a-f]+)'
-            match = re.search(next_page_hash_regex, next_page_url)
-            if match:
-                next_page_hash = match.group('hash')
+        next_page_hash = self.extract_next_page_hash(json_response)
 
         json_episode_list = utils.try_get(
             json_response, 'episodes', data_type=list, default=[])
@@ -622,9 +1530,9 @@ class SRGSSR(object):
             next_item.setProperty('IsPlayable', 'false')
             url = self.build_url(
                 mode=20, name=show_id, page_hash=next_page_hash)
-            xbmcplugin.addDirectoryItem(
-                self.handle, url, next_item, isFolder=True)
+            self.add_directory_item(url, next_item, is_folder=True)
 
+    @directory_builder
     def build_topics_overview_menu(self, newest_or_most_clicked):
         """
         Builds a list of folders, where each folders represents a
@@ -644,7 +1552,7 @@ class SRGSSR(object):
                 must be "Newest" or "Most clicked".')
             return
         topics_url = self.host_url + '/play/tv/topicList'
-        topics_json = json.loads(self.open_url(topics_url))
+        topics_json = self.get_json(topics_url, allow_stale=True)
         if not isinstance(topics_json, list) or not topics_json:
             self.log('No topics found.')
             return
@@ -655,14 +1563,13 @@ class SRGSSR(object):
             name = utils.try_get(elem, 'id')
             if name:
                 purl = self.build_url(mode=mode, name=name)
-                xbmcplugin.addDirectoryItem(
-                    handle=self.handle, url=purl,
-                    listitem=list_item, isFolder=True)
+                self.add_directory_item(purl, list_item, is_folder=True)
 
     def extract_id_list(self, url, editor_picks=False):
         """
         Opens a webpage and extracts video ids (of the form "id": "<vid>")
-        from JavaScript snippets.
+        from JavaScript snippets. Duplicate ids are removed, the order of
+        their first occurrence is kept.
 
         Keyword argmuents:
         url           -- the URL of the webpage
@@ -670,27 +1577,15 @@ class SRGSSR(object):
                          (default: False)
         """
         self.log('extract_id_list, url = %s' % url)
-        response = self.open_url(url)
-        string_response = utils.str_or_none(response, default='')
-        if not string_response:
+        flag = 'isEditorPick' if editor_picks else None
+        id_list = self.extract_from_url(
+            url, 'extract_id_list, flag = %s' % flag,
+            lambda webpage: utils.find_unique_ids(webpage, IDREGEX, flag))
+        if not id_list:
             self.log('No video ids found on %s' % url)
-            return []
-        readable_string_response = string_response.replace('&quot;', '"')
-        id_regex = r'''(?x)
-                        \"id\"
-                        \s*:\s*
-                        \"
-                        (?P<id>
-                            %s
-                        )
-                        \"
-                    ''' % IDREGEX
-        if editor_picks:
-            id_regex += r'.+\"isEditorPick\"\s*:\s*true'
-        id_list = [m.group('id') for m in re.finditer(
-            id_regex, readable_string_response)]
         return id_list
 
+    @directory_builder
     def build_topics_menu(self, name, topic_id=None, page=1):
         """
         Builds a list of videos (can also be folders) for a given topic.
@@ -737,54 +1632,96 @@ class SRGSSR(object):
 
         reduced_id_list = id_list[(page - 1) * self.number_of_episodes:
                                   page * self.number_of_episodes]
-        for vid in reduced_id_list:
-            self.build_episode_menu(
-                vid, include_segments=False,
-                segment_option=self.segments_topics)
+        self.build_episode_menus(
+            reduced_id_list, include_segments=False,
+            segment_option=self.segments_topics)
 
-        try:
-            vid = id_list[page*self.number_of_episodes]
+        if len(id_list) > page * self.number_of_episodes:
             next_item = xbmcgui.ListItem(
                 label='>> ' + LANGUAGE(30073))  # Next page
             next_item.setProperty('IsPlayable', 'false')
             name = topic_id if topic_id else ''
             purl = self.build_url(mode=mode, name=name, page=page+1)
-            xbmcplugin.addDirectoryItem(
-                handle=self.handle, url=purl,
-                listitem=next_item, isFolder=True)
-        except IndexError:
-            return
+            self.add_directory_item(purl, next_item, is_folder=True)
 
-    def build_episode_menu(self, video_id, include_segments=True,
-                           segment_option=False, audio=False):
+    def read_media_composition(self, video_id, audio=False):
         """
-        Builds a list entry for a episode by a given video id.
-        The segment entries for that episode can be included too.
-        The video id can be an id of a segment. In this case an
-        entry for the segment will be created.
+        Downloads and parses the media composition of a given video id.
+        Returns None in case of failure.
 
         Keyword arguments:
-        video_id         -- the id of the video
-        include_segments -- indicates if the segments (if available) of the
-                            video should be included in the list
-                            (default: True)
-        segment_option   -- Which segment option to use.
-                            (default: False)
-        audio            -- boolean value to indicate if the episode is a
-                            radio show (default: False)
+        video_id  -- the id of the video
+        audio     -- boolean value to indicate if the media is
+                     audio (default: False)
         """
-        self.log('build_episode_menu, video_id = %s, include_segments = %s' %
-                 (video_id, include_segments))
         content_type = 'audio' if audio else 'video'
         json_url = ('https://il.srgssr.ch/integrationlayer/2.0/%s/'
                     'mediaComposition/%s/%s.json') % (self.bu, content_type,
                                                       video_id)
-        self.log('build_episode_menu. Open URL %s' % json_url)
+        self.log('read_media_composition. Open URL %s' % json_url)
         try:
-            json_response = json.loads(self.open_url(json_url))
+            return self.get_json(json_url)
         except Exception:
-            self.log('build_episode_menu: Cannot open media json for %s.'
+            self.log('read_media_composition: Cannot open media json for %s.'
                      % video_id)
+            return None
+
+    @directory_builder
+    def build_episode_menus(self, video_ids, include_segments=True,
+                            segment_option=False, audio=False):
+        """
+        Builds the list entries for several episodes. The media compositions
+        of all the episodes are downloaded concurrently first, the entries
+        are then built in the order of the given video ids.
+
+        Keyword arguments:
+        video_ids        -- a list of video ids
+        include_segments -- see build_episode_menu (default: True)
+        segment_option   -- see build_episode_menu (default: False)
+        audio            -- see build_episode_menu (default: False)
+        """
+        self.log('build_episode_menus, number of videos = %d' %
+                 len(video_ids))
+        compositions = utils.parallel_map(
+            lambda vid: self.read_media_composition(vid, audio=audio),
+            video_ids, max_workers=self.max_workers)
+        for video_id, composition in zip(video_ids, compositions):
+            if composition is None:
+                continue
+            self.build_episode_menu(
+                video_id, include_segments=include_segments,
+                segment_option=segment_option, audio=audio,
+                media_composition=composition)
+
+    @directory_builder
+    def build_episode_menu(self, video_id, include_segments=True,
+                           segment_option=False, audio=False,
+                           media_composition=None):
+        """
+        Builds a list entry for a episode by a given video id.
+        The segment entries for that episode can be included too.
+        The video id can be an id of a segment. In this case an
+        entry for the segment will be created.
+
+        Keyword arguments:
+        video_id          -- the id of the video
+        include_segments  -- indicates if the segments (if available) of the
+                             video should be included in the list
+                             (default: True)
+        segment_option    -- Which segment option to use.
+                             (default: False)
+        audio             -- boolean value to indicate if the episode is a
+                             radio show (default: False)
+        media_composition -- the already parsed media composition of the
+                             video; if not provided, it will be downloaded
+                             (default: None)
+        """
+        self.log('build_episode_menu, video_id = %s, include_segments = %s' %
+                 (video_id, include_segments))
+        json_response = media_composition
+        if json_response is None:
+            json_response = self.read_media_composition(video_id, audio=audio)
+        if json_response is None:
             return
 
         chapter_urn = utils.try_get(json_response, 'chapterUrn')
@@ -857,6 +1794,7 @@ class SRGSSR(object):
             # Generate a simple playable item for the video
             self.build_entry(json_segment, banner)
 
+    @directory_builder
     def build_entry(
             self, json_entry, banner=None, is_folder=False, audio=False):
         """
@@ -930,9 +1868,9 @@ class SRGSSR(object):
         else:
             list_item.setProperty('IsPlayable', 'true')
             url = self.build_url(mode=50, name=vid)
-        xbmcplugin.addDirectoryItem(
-            self.handle, url, list_item, isFolder=is_folder)
+        self.add_directory_item(url, list_item, is_folder=is_folder)
 
+    @directory_builder
     def build_dates_overview_menu(self):
         """
         Builds the menu containing the folders for episodes of
@@ -940,6 +1878,17 @@ class SRGSSR(object):
         """
         self.log('build_dates_overview_menu')
 
+        weekdays = (
+            self.language(30060),  # Monday
+            self.language(30061),  # Tuesday
+            self.language(30062),  # Wednesday
+            self.language(30063),  # Thursday
+            self.language(30064),  # Friday
+            self.language(30065),  # Saturday
+            self.language(30066)   # Sunday
+        )
+        today = datetime.date.today()
+
         def folder_name(dato):
             """
             Generates a Kodi folder name from an date object.
@@ -947,16 +1896,6 @@ class SRGSSR(object):
             Keyword arguments:
             dato -- a date object
             """
-            weekdays = (
-                self.language(30060),  # Monday
-                self.language(30061),  # Tuesday
-                self.language(30062),  # Wednesday
-                self.language(30063),  # Thursday
-                self.language(30064),  # Friday
-                self.language(30065),  # Saturday
-                self.language(30066)   # Sunday
-            )
-            today = datetime.date.today()
             if dato == today:
                 name = self.language(30058)  # Today
             elif dato == today + datetime.timedelta(-1):
@@ -966,25 +1905,20 @@ class SRGSSR(object):
                                    dato.strftime('%d.%m.%Y'))
             return name
 
-        current_date = datetime.date.today()
         number_of_days = 7
 
         for i in range(number_of_days):
-            dato = current_date + datetime.timedelta(-i)
+            dato = today + datetime.timedelta(-i)
             list_item = xbmcgui.ListItem(label=folder_name(dato))
             list_item.setArt({'thumb': self.icon})
             name = dato.strftime('%d-%m-%Y')
             purl = self.build_url(mode=24, name=name)
-            xbmcplugin.addDirectoryItem(
-                handle=self.handle, url=purl,
-                listitem=list_item, isFolder=True)
+            self.add_directory_item(purl, list_item, is_folder=True)
 
         choose_item = xbmcgui.ListItem(label=LANGUAGE(30071))  # Choose date
         choose_item.setArt({'thumb': self.icon})
         purl = self.build_url(mode=25)
-        xbmcplugin.addDirectoryItem(
-            handle=self.handle, url=purl,
-            listitem=choose_item, isFolder=True)
+        self.add_directory_item(purl, choose_item, is_folder=True)
 
     def pick_date(self):
         """
@@ -1010,6 +1944,7 @@ class SRGSSR(object):
         else:
             self.build_dates_overview_menu()
 
+    @directory_builder
     def build_date_menu(self, date_string):
         """
         Builds a list of episodes of a given date.
@@ -1023,11 +1958,10 @@ class SRGSSR(object):
         url = self.host_url + '/play/tv/programDay/%s' % date_string
         id_list = self.extract_id_list(url)
 
-        for vid in id_list:
-            self.build_episode_menu(
-                vid, include_segments=False,
-                segment_option=self.segments)
+        self.build_episode_menus(
+            id_list, include_segments=False, segment_option=self.segments)
 
+    @directory_builder
     def build_search_menu(self, audio=False):
         """
         Builds a menu for searches.
@@ -1073,9 +2007,9 @@ class SRGSSR(object):
                 }
             )
             url = self.build_url(item['mode'])
-            xbmcplugin.addDirectoryItem(
-                handle=self.handle, url=url, listitem=list_item, isFolder=True)
+            self.add_directory_item(url, list_item, is_folder=True)
 
+    @directory_builder
     def build_recent_search_menu(self, show_or_media, audio=False):
         """
         Lists folders for the most recent searches.
@@ -1102,9 +2036,9 @@ class SRGSSR(object):
             list_item.setProperty('IsPlayable', 'false')
             list_item.setArt({'thumb': self.icon})
             url = self.build_url(mode=mode, name=search)
-            xbmcplugin.addDirectoryItem(
-                handle=self.handle, url=url, listitem=list_item, isFolder=True)
+            self.add_directory_item(url, list_item, is_folder=True)
 
+    @directory_builder
     def build_search_media_menu(self, mode=28, name='', page=1,
                                 page_hash='', audio=False):
         """
@@ -1159,7 +2093,7 @@ class SRGSSR(object):
             query_string = quote_plus(query_string)
             query_url = url_layout % (
                 query_string, self.number_of_episodes, media_type)
-        result = json.loads(self.open_url(query_url, use_cache=False))
+        result = self.get_json(query_url)
         media_ids = [
             m['id'] for m in utils.try_get(
                 result, 'media', data_type=list,
@@ -1180,17 +2114,22 @@ class SRGSSR(object):
             nurl = self.build_url(
                 mode=mode, name=query_string,
                 page_hash=next_page_hash, page=page+1)
-            xbmcplugin.addDirectoryItem(
-                self.handle, nurl, next_item, isFolder=True)
+            self.add_directory_item(nurl, next_item, is_folder=True)
 
-    def build_search_show_menu(self, name='', audio=False):
+    @directory_builder
+    def build_search_show_menu(self, name='', audio=False,
+                               remote_fallback=True):
         """
-        Peforms a search for shows.
+        Peforms a search for shows. The search is performed locally in the
+        show catalog first. Only if nothing is found there, the search
+        API is used.
 
         Keyword arguments:
-        name   -- search query (default: '')
-        audio  -- boolean; if set, audio shows will be searched, otherwise
-                  video shows (default: False)
+        name            -- search query (default: '')
+        audio           -- boolean; if set, audio shows will be searched,
+                           otherwise video shows (default: False)
+        remote_fallback -- boolean; if set, the search API is used if no
+                           show was found locally (default: True)
         """
         self.log(
             'build_search_show_menu, name = %s, audio = %s' % (name, audio))
@@ -1209,9 +2148,24 @@ class SRGSSR(object):
                 query_string = query_string.encode('utf8')
             if True:
                 self.write_search(RECENT_SHOW_SEARCHES_FILENAME, query_string)
+
+        try:
+            if audio:
+                catalog = self.get_show_catalog('radio')
+            else:
+                catalog = self.get_all_shows_catalog()
+            shows = catalog.search(query_string)
+        except ValueError:
+            self.log('build_search_show_menu: Show catalog not available')
+            shows = []
+        if shows or not remote_fallback:
+            for show in shows:
+                self.build_show_entry(show)
+            return
+
         query_string = quote_plus(query_string)
         query_url = url_layout % query_string
-        result = json.loads(self.open_url(query_url, use_cache=False))
+        result = self.get_json(query_url)
         indicator = ':radio:' if audio else ':tv:'
         show_ids = [m['id'] for m in utils.try_get(
             result, 'shows', data_type=list, default=[]) if (
@@ -1231,10 +2185,9 @@ class SRGSSR(object):
         self.log('get_auth_url, url = %s' % url)
         # spl = urlparse.urlparse(url).path.split('/')
         spl = urlps(url).path.split('/')
-        token = json.loads(
-            self.open_url(
-                'http://tp.srgssr.ch/akahd/token?acl=/%s/%s/*' %
-                (spl[1], spl[2]), use_cache=False)) or {}
+        token = self.get_json(
+            'http://tp.srgssr.ch/akahd/token?acl=/%s/%s/*' %
+            (spl[1], spl[2]), use_cache=False) or {}
         auth_params = token.get('token', {}).get('authparams')
         if segment_data:
             # timestep_string = self._get_timestep_token(segment_data)
@@ -1259,7 +2212,7 @@ class SRGSSR(object):
                     'mediaComposition/%s/%s.json') % (self.bu, content_type,
                                                       video_id)
         self.log('play_video. Open URL %s' % json_url)
-        json_response = json.loads(self.open_url(json_url))
+        json_response = self.get_json(json_url)
 
         chapter_list = utils.try_get(
             json_response, 'chapterList', data_type=list, default=[])
@@ -1369,20 +2322,16 @@ class SRGSSR(object):
         his/her personal favourite show list.
         """
         if audio:
-            show_list = self.extract_shows_information('radio')
+            catalog = self.get_show_catalog('radio')
         else:
-            show_list = self.read_all_available_shows()
+            catalog = self.get_all_shows_catalog()
         stored_favids = self.read_favourite_show_ids()
-        names = [x['title'] for x in show_list]
-        ids = [x['id'] for x in show_list]
+        names = catalog.titles()
+        ids = catalog.ids()
 
-        preselect_inds = []
-        for stored_id in stored_favids:
-            try:
-                preselect_inds.append(ids.index(stored_id))
-            except ValueError:
-                pass
-        ancient_ids = [x for x in stored_favids if x not in ids]
+        preselect_inds = [
+            catalog.index(x) for x in stored_favids if x in catalog]
+        ancient_ids = [x for x in stored_favids if x not in catalog]
 
         dialog = xbmcgui.Dialog()
         # Choose your favourite shows
@@ -1496,6 +2445,7 @@ class SRGSSR(object):
     #             continue
     #         self.build_entry(json_entry)
 
+    @directory_builder
     def build_live_menu(self, extract_srf3=False):
         """
         Builds the menu listing the currently available livestreams.
@@ -1506,22 +2456,18 @@ class SRGSSR(object):
             possible livestreams. If some live events were found, a list
             of live ids will be returned, otherwise an empty list.
             """
-            live_ids = []
-            webpage = self.open_url(self.host_url, use_cache=False)
             event_id_regex = r'(?:data-sport-id=\"|eventId=)(?P<live_id>\d+)'
-            try:
-                for match in re.finditer(event_id_regex, webpage):
-                    live_ids.append(match.group('live_id'))
-            except StopIteration:
-                pass
-            return live_ids
+            return self.extract_from_url(
+                self.host_url, 'build_live_menu', lambda webpage: [
+                    match.group('live_id') for match in re.finditer(
+                        event_id_regex, webpage)],
+                ttl=LIVE_TTL)
 
         def get_srf3_live_ids():
             """
             Returns a list of Radio SRF 3 video streams.
             """
             url = 'https://www.srf.ch/radio-srf-3'
-            webpage = self.open_url(url, use_cache=False)
             video_id_regex = r'''(?x)
                                    popupvideoplayer\?id=
                                    (?P<video_id>
@@ -1532,18 +2478,16 @@ class SRGSSR(object):
                                        [a-f0-9]{12}
                                     )
                                 '''
-            live_ids = []
-            try:
-                for match in re.finditer(video_id_regex, webpage):
-                    live_ids.append(match.group('video_id'))
-            except StopIteration:
-                pass
-            return live_ids
+            return self.extract_from_url(
+                url, 'build_live_menu, srf3', lambda webpage: [
+                    match.group('video_id') for match in re.finditer(
+                        video_id_regex, webpage)],
+                ttl=LIVE_TTL)
         live_ids = get_live_ids()
         for lid in live_ids:
             api_url = ('https://event.api.swisstxt.ch/v1/events/'
                        '%s/byEventItemId/?eids=%s') % (self.bu, lid)
-            live_json = json.loads(self.open_url(api_url))
+            live_json = self.get_json(api_url)
             entry = utils.try_get(live_json, 0, data_type=dict, default={})
             if not entry:
                 self.log('build_live_menu: No entry found '
@@ -1558,8 +2502,7 @@ class SRGSSR(object):
             item.setProperty('IsPlayable', 'true')
             item.setArt({'thumb': image})
             purl = self.build_url(mode=51, name=stream_url)
-            xbmcplugin.addDirectoryItem(
-                self.handle, purl, item, isFolder=False)
+            self.add_directory_item(purl, item, is_folder=False)
         if extract_srf3:
             srf3_ids = get_srf3_live_ids()
             for vid in srf3_ids:
@@ -1577,13 +2520,12 @@ class SRGSSR(object):
         """
         self.log('get_radio_channels')
         cache_id = self.addon_id + '.radio_channels'
-        # channels = self.cache.get(cache_id)
-        channels = []
+        channels = None if self.revalidate else self.cache.get(cache_id)
         if channels:
             return channels
 
         url = '%s/play/radio/live/overview' % self.host_url
-        channel_json = json.loads(self.open_url(url))
+        channel_json = self.get_json(url)
         channel_list = utils.try_get(
             channel_json, 'overview', data_type=list, default=[])
 
@@ -1600,7 +2542,7 @@ class SRGSSR(object):
                    'mediaComposition/audio/%s.json') % (self.bu, id)
 
             # TODO: error handling
-            detailed_content = json.loads(self.open_url(url))
+            detailed_content = self.get_json(url)
             image = utils.try_get(
                 detailed_content, ('episode', 'imageUrl')) or utils.try_get(
                 detailed_content, ('show', 'imageUrl')) or utils.try_get(
@@ -1649,24 +2591,30 @@ class SRGSSR(object):
             }]
         live_radio_list = []
         regex = r'title\s*:\s*"[^"]+?".+?mp3\s*:\s*"(?P<stream>[^"]+?)"'
+
+        def extract_stream(webpage):
+            match = re.search(regex, webpage)
+            return match.group('stream') if match else None
+
         for info in radio_info:
             try:
-                webpage = self.open_url(info['url'])
+                stream = self.extract_from_url(
+                    info['url'], 'get_live_radio_channels', extract_stream)
             except Exception:
                 self.log('get_live_radio_channels: Unable to open '
                          'webpage %s' % info['url'])
                 continue
-            match = re.search(regex, webpage)
-            if not match:
+            if not stream:
                 self.log('get_live_radio_channels: Unable to extract stream '
                          'for %s' % info['name'])
                 continue
             info.update({
-                'stream': match.group('stream')
+                'stream': stream
             })
             live_radio_list.append(info)
         return live_radio_list
 
+    @directory_builder
     def build_radio_channels_menu(self):
         """
         Builds a menu containing folders of the available radio channels which
@@ -1681,9 +2629,9 @@ class SRGSSR(object):
                 'thumb': ch['image'],
             })
             purl = self.build_url(41, name=ch['channelId'])
-            xbmcplugin.addDirectoryItem(
-                self.handle, purl, list_item, isFolder=True)
+            self.add_directory_item(purl, list_item, is_folder=True)
 
+    @directory_builder
     def build_radio_channel_overview(self, channel_id):
         """
         Builds the overview menu of a given radio channel.
@@ -1724,6 +2672,7 @@ class SRGSSR(object):
         ]
         self.build_folder_menu(menu_list)
 
+    @directory_builder
     def build_audio_menu(self, playlist, mode, channel_id=None, page=1):
         """
         Builds a menu containing audio items.
@@ -1761,23 +2710,17 @@ class SRGSSR(object):
 
         reduced_id_list = id_list[(page - 1) * self.number_of_episodes:
                                   page * self.number_of_episodes]
-        for vid in reduced_id_list:
-            self.build_episode_menu(
-                vid, include_segments=False,
-                segment_option=self.segments_topics, audio=True)
+        self.build_episode_menus(
+            reduced_id_list, include_segments=False,
+            segment_option=self.segments_topics, audio=True)
 
-        try:
-            vid = id_list[page*self.number_of_episodes]
+        if len(id_list) > page * self.number_of_episodes:
             next_item = xbmcgui.ListItem(
                 label='>> ' + LANGUAGE(30073))  # Next page
             next_item.setProperty('IsPlayable', 'false')
             name = channel_id
             purl = self.build_url(mode=mode, name=name, page=page+1)
-            xbmcplugin.addDirectoryItem(
-                handle=self.handle, url=purl,
-                listitem=next_item, isFolder=True)
-        except IndexError:
-            return
+            self.add_directory_item(purl, next_item, is_folder=True)
 
     def parse_embedded_json(self, url, regex):
         """
@@ -1789,18 +2732,22 @@ class SRGSSR(object):
                   embedded json
         """
         self.log('parse_embedded_json: url = %s, regex = %s' % (url, regex))
-        webpage = self.open_url(url)
-        match = re.search(regex, webpage, re.DOTALL)
-        if not match:
-            self.log('parse_embedded_json: Unable to find regular expression')
-            return {}
-        data = match.group(1).replace('&quot;', '"').replace('&amp;', '&')
-        try:
-            parsed = json.loads(data, strict=False)
-        except Exception:
-            self.log('parse_embedded_json: Unable to parse json')
-            parsed = {}
-        return parsed
+
+        def extract(webpage):
+            match = re.search(regex, webpage, re.DOTALL)
+            if not match:
+                self.log('parse_embedded_json: Unable to find regular '
+                         'expression')
+                return {}
+            data = match.group(1).replace('&quot;', '"').replace(
+                '&amp;', '&')
+            try:
+                return json.loads(data, strict=False)
+            except Exception:
+                self.log('parse_embedded_json: Unable to parse json')
+                return {}
+        return self.extract_from_url(
+            url, 'parse_embedded_json, regex = %s' % regex, extract)
 
     def extract_shows_information(self, radio_tv, channel_id=None):
         """
@@ -1824,15 +2771,22 @@ class SRGSSR(object):
         # the channel id. In this case we need to make seperate requests
         # for every radio channel and merge the results:
         if radio_tv == 'radio' and not channel_id:
+            cache_id = self.addon_id + '.radio_shows'
+            shows = self.cache.get(cache_id)
+            if shows and not self.revalidate:
+                return shows
             channels = self.get_radio_channels()
-            # TODO: In the future, this should be done by multiprocessing
-            # for the platforms that support it
-            channel_shows = [
-                self.extract_shows_information(
-                    radio_tv, channel_id=channel['channelId']
-                    ) for channel in channels]
-            return sorted(utils.generate_unique_list(
-                channel_shows, 'id'), key=lambda k: k['title'].lower())
+            channel_shows = utils.parallel_map(
+                lambda channel: self.extract_shows_information(
+                    radio_tv, channel_id=channel['channelId']),
+                channels, max_workers=self.max_workers, default=[])
+            shows = sorted(
+                utils.iter_unique(channel_shows, key=lambda k: k['id']),
+                key=lambda k: k['title'].lower())
+            if shows:
+                self.cache.set(
+                    cache_id, shows, expiration=datetime.timedelta(hours=2))
+            return shows
 
         url = '%s/play/%s/shows/alphabetical-sections' % (
             self.host_url, radio_tv)
@@ -1884,6 +2838,7 @@ class SRGSSR(object):
                 })
         return topic_list
 
+    @directory_builder
     def build_radio_topics_menu(self):
         """
         Builds a menu for the hosted radio topics.
@@ -1897,18 +2852,19 @@ class SRGSSR(object):
             })
             purl = self.build_url(mode=49, name=entry['url'])
             list_item.setProperty('IsPlayable', 'false')
-            xbmcplugin.addDirectoryItem(
-                self.handle, purl, list_item, isFolder=True)
+            self.add_directory_item(purl, list_item, is_folder=True)
 
     # Only works for SRF:
+    @directory_builder
     def build_radio_shows_by_topic(self, url):
         self.log('build_radio_shows_by_topic, url = %s' % url)
         url = '%s%s' % (self.host_url, url)
-        json_content = json.loads(self.open_url(url))
+        json_content = self.get_json(url)
         ids = [utils.try_get(x, 'id') for x in utils.try_get(
             json_content, 'teaser', list, []) if utils.try_get(x, 'id')]
         self.build_shows_menu('radio', favids=ids)
 
+    @directory_builder
     def build_shows_menu(self, radio_tv, channel_id=None, favids=None):
         """
         Builds a menu of available shows.
@@ -1929,35 +2885,46 @@ class SRGSSR(object):
             self.log('build_shows_menu: Invalid value for radio_tv')
             return
 
-        shows = self.extract_shows_information(radio_tv, channel_id=channel_id)
+        shows = self.get_show_catalog(radio_tv, channel_id=channel_id)
         if favids is not None:
-            shows = [show for show in shows if show['id'] in favids]
+            shows = shows.select(favids)
 
         for show in shows:
-            list_item = xbmcgui.ListItem(label=show['title'])
-            list_item.setProperty('IsPlayable', 'false')
-            list_item.setArt({
-                'thumb': show['imageUrl'],
-                'poster': show['imageUrl'],
-                'banner': show['bannerImageUrl'],
-            })
-            list_item.setInfo(
-                'video',
-                {
-                    'title': show['title'],
-                    'plot': show['lead'] or show['description'],
-                }
-            )
-            surl = self.build_url(mode=20, name=show['id'])
-            xbmcplugin.addDirectoryItem(
-                self.handle, surl, list_item, isFolder=True)
+            self.build_show_entry(show)
+
+    @directory_builder
+    def build_show_entry(self, show):
+        """
+        Builds a folder for a show of a ShowCatalog.
+
+        Keyword arguments:
+        show  -- the show dictionary
+        """
+        list_item = xbmcgui.ListItem(label=show['title'])
+        list_item.setProperty('IsPlayable', 'false')
+        list_item.setArt({
+            'thumb': show['imageUrl'] or self.icon,
+            'poster': show['imageUrl'] or self.fanart,
+            'banner': show['bannerImageUrl'],
+        })
+        list_item.setInfo(
+            'video',
+            {
+                'title': show['title'],
+                'plot': show['lead'] or show['description'],
+            }
+        )
+        surl = self.build_url(mode=20, name=show['id'])
+        self.add_directory_item(surl, list_item, is_folder=True)
 
     # TODO: Merge this with build_favourite_shows_menu
+    @directory_builder
     def build_favourite_radio_shows_menu(self):
         self.log('build_favourite_radio_shows_menu')
         favids = self.read_favourite_show_ids()
         self.build_shows_menu('radio', favids=favids)
 
+    @directory_builder
     def build_live_radio_menu(self, include_live_only=True):
         """
         Builds a Kodi menu for the live radio channels.
@@ -1980,8 +2947,7 @@ class SRGSSR(object):
                 purl = self.build_url(mode=50, name=ch['id'])
             except KeyError:
                 purl = self.build_url(mode=51, name=ch['stream'])
-            xbmcplugin.addDirectoryItem(
-                self.handle, purl, list_item, isFolder=False)
+            self.add_directory_item(purl, list_item, is_folder=False)
 
     def _read_youtube_channels(self, fname):
         """
@@ -2012,6 +2978,7 @@ class SRGSSR(object):
             self.cache.set(cache_identifier, channel_ids)
         return channel_ids
 
+    @directory_builder
     def build_youtube_main_menu(self):
         """
         Builds the main YouTube menu.
@@ -2031,9 +2998,9 @@ class SRGSSR(object):
                 'icon': self.get_youtube_icon(),
             })
             purl = self.build_url(mode=item['mode'])
-            xbmcplugin.addDirectoryItem(
-                self.handle, purl, list_item, isFolder=True)
+            self.add_directory_item(purl, list_item, is_folder=True)
 
+    @directory_builder
     def build_youtube_channel_overview_menu(self, mode):
         """
         Builds a menu of folders containing the plugin's
@@ -2043,6 +3010,7 @@ class SRGSSR(object):
         channel_ids  -- a list of YouTube channel IDs
         mode         -- the plugin's URL mode
         """
+        import youtube_channels
         channel_ids = self.get_youtube_channel_ids()
         plugin_url = self.build_url(mode=mode, name='%s')
         youtube_channels.YoutubeChannels(
@@ -2050,6 +3018,7 @@ class SRGSSR(object):
             self.addon_id, self.debug).build_channel_overview_menu(
                 plugin_channel_url=plugin_url)
 
+    @directory_builder
     def build_youtube_channel_menu(self, cid, mode, page=1, page_token=''):
         """
         Builds a YouTube channel menu (containing a list of the
@@ -2071,6 +3040,7 @@ class SRGSSR(object):
         except TypeError:
             page = 1
 
+        import youtube_channels
         channel_ids = self.get_youtube_channel_ids()
         next_page_token = youtube_channels.YoutubeChannels(
             self.handle, channel_ids,
@@ -2081,9 +3051,9 @@ class SRGSSR(object):
             next_url = self.build_url(
                 mode=mode, name=cid, page_hash=next_page_token)
             next_item.setProperty('IsPlayable', 'false')
-            xbmcplugin.addDirectoryItem(
-                self.handle, next_url, next_item, isFolder=True)
+            self.add_directory_item(next_url, next_item, is_folder=True)
 
+    @directory_builder
     def build_youtube_newest_videos_menu(self, mode, page=1):
         """
         Builds a YouTube menu containing the most recent uploaded
@@ -2099,6 +3069,7 @@ class SRGSSR(object):
         except TypeError:
             page = 1
 
+        import youtube_channels
         channel_ids = self.get_youtube_channel_ids()
         next_page = youtube_channels.YoutubeChannels(
             self.handle, channel_ids,
@@ -2107,5 +3078,8 @@ class SRGSSR(object):
             next_item = xbmcgui.ListItem(label='>> ' + LANGUAGE(30073))
             next_url = self.build_url(mode=mode, page=next_page)
             next_item.setProperty('IsPlayable', 'false')
-            xbmcplugin.addDirectoryItem(
-                self.handle, next_url, next_item, isFolder=True)
+            self.add_directory_item(next_url, next_item, is_folder=True)
+
+
+# Time needed to import this module (set once the import is complete).
+IMPORT_TIME = time.time() - _MODULE_START
@@ -19,9 +19,20 @@
 # along with script.module.srgssr.
 # If not, see <http://www.gnu.org/licenses/>.
 
+import codecs
+import collections
 import datetime
+import heapq
+import json
 import re
 import sys
+import threading
+import time
+
+try:  # Python 3
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
 
 try:
     CompatStr = unicode  # Python2
@@ -115,6 +126,69 @@ def get_duration(duration_string):
     return None
 
 
+# Identifiers of the weekdays (Monday to Sunday), followed by the
+# identifiers for yesterday, today and tomorrow in German, French,
+# Italian and English.
+WEEKDAY_IDENTIFIERS = {
+    'german': (
+        u'Montag', u'Dienstag', u'Mittwoch', u'Donnerstag', u'Freitag',
+        u'Samstag', u'Sonntag', u'gestern', u'heute', u'morgen',
+    ),
+    'french': (
+        u'Lundi', u'Mardi', u'Mercredi', u'Jeudi', u'Vendredi', u'Samedi',
+        u'Dimanche', u'hier', u'aujourd\'hui', u'demain',
+    ),
+    'italian': (
+        u'Lunedì', u'Martedì', u'Mercoledì', u'Giovedì', u'Venerdì',
+        u'Sabato', u'Domenica', u'ieri', u'oggi', u'domani',
+    ),
+    'english': (
+        u'Monday', u'Tuesday', u'Wednesday', u'Thursday', u'Friday',
+        u'Saturday', u'Sunday', u'yesterday', u'today', u'tomorrow',
+    ),
+}
+
+# Maps the lower case identifiers to their index in the above tuples.
+_WEEKDAY_INDEX = dict(
+    (identifier.lower(), index)
+    for identifiers in WEEKDAY_IDENTIFIERS.values()
+    for index, identifier in enumerate(identifiers))
+
+_RECENT_DATE_REGEX = re.compile(
+    r'(?P<weekday>[a-zA-z\'' + u'ì' + r']+)'
+    r'\s*,\s*'
+    r'(?P<hour>\d{2})(:|h)'
+    r'(?P<minute>\d{2})'
+    r'(:(?P<second>\d{2}))?')
+
+_FULL_DATE_REGEX = re.compile(r'''(?x)
+                                (?P<day>\d{2})\.
+                                (?P<month>\d{2})\.
+                                (?P<year>\d{4})
+                                \s*,?\s*
+                                (?P<hour>\d{2})(:|h)
+                                (?P<minute>\d{2})
+                                (:
+                                    (?P<second>\d{2})
+                                )?
+                            ''')
+
+_DATE_TIME_TZ_REGEX = re.compile(r'''(?x)
+                                    (?P<dt>
+                                        \d{4}-\d{2}-\d{2}T\d{2}(:|h)\d{2}:\d{2}
+                                    )
+                                    (?P<tz>
+                                        (?:[-+]\d{2}(:|h)\d{2}|Z)
+                                    )
+                                ''')
+
+# Memo for parse_datetime. The results for strings containing a weekday
+# depend on the current date, so the memo is cleared when the date changes.
+PARSE_DATETIME_MEMO_SIZE = 4096
+_parse_datetime_memo = {}
+_parse_datetime_memo_date = [None]
+
+
 def parse_datetime(input_string):
     """
     Tries to create a datetime object from a given input string. There are
@@ -125,13 +199,25 @@ def parse_datetime(input_string):
     Keyword arguments:
     input_string -- a string to convert into a datetime object
     """
-    date_time = _parse_weekday_time(input_string)
-    if date_time:
-        return date_time
-    date_time = _parse_date_time(input_string)
-    if date_time:
-        return date_time
-    date_time = _parse_date_time_tz(input_string)
+    today = datetime.date.today()
+    if _parse_datetime_memo_date[0] != today:
+        _parse_datetime_memo.clear()
+        _parse_datetime_memo_date[0] = today
+    try:
+        return _parse_datetime_memo[input_string]
+    except KeyError:
+        pass
+
+    # Only the weekday form starts with a letter.
+    if input_string[:1].isdigit():
+        date_time = _parse_date_time(input_string) or \
+            _parse_date_time_tz(input_string)
+    else:
+        date_time = _parse_weekday_time(input_string)
+
+    if len(_parse_datetime_memo) >= PARSE_DATETIME_MEMO_SIZE:
+        _parse_datetime_memo.clear()
+    _parse_datetime_memo[input_string] = date_time
     return date_time
 
 
@@ -147,15 +233,7 @@ def _parse_date_time_tz(input_string):
     Keyword arguments:
     input_string -- a string of the above form
     """
-    dt_regex = r'''(?x)
-                    (?P<dt>
-                        \d{4}-\d{2}-\d{2}T\d{2}(:|h)\d{2}:\d{2}
-                    )
-                    (?P<tz>
-                        (?:[-+]\d{2}(:|h)\d{2}|Z)
-                    )
-                '''
-    match = re.match(dt_regex, input_string)
+    match = _DATE_TIME_TZ_REGEX.match(input_string)
     if match:
         dts = match.group('dt')
         # We ignore timezone information for now
@@ -183,131 +261,43 @@ def _parse_weekday_time(input_string):
     <weekday>,? %H:%M(:S)?
     where <weekday> is either a german name of a weekday
     ('Montag', 'Dienstag', ...) or 'gestern', 'heute', 'morgen'.
-    Other supported languages are English, French and Italian.
+    Other supported languages are English, French and Italian
+    (see WEEKDAY_IDENTIFIERS).
     If it is not possible to create a datetime object from
     the given input string, a NoneType will be returned.
 
     Keyword arguments:
     input_string -- a string of the above form
     """
-    weekdays_german = (
-        'Montag',
-        'Dienstag',
-        'Mittwoch',
-        'Donnerstag',
-        'Freitag',
-        'Samstag',
-        'Sonntag',
-    )
-    special_weekdays_german = (
-        'gestern',
-        'heute',
-        'morgen',
-    )
-    identifiers_german = weekdays_german + special_weekdays_german
-
-    weekdays_french = (
-        'Lundi',
-        'Mardi',
-        'Mercredi',
-        'Jeudi',
-        'Vendredi',
-        'Samedi',
-        'Dimanche',
-    )
-    special_weekdays_french = (
-        'hier',
-        'aujourd\'hui',
-        'demain',
-    )
-    identifiers_french = weekdays_french + special_weekdays_french
-
-    weekdays_italian = (
-        'Lunedì',
-        'Martedì',
-        'Mercoledì',
-        'Giovedì',
-        'Venerdì',
-        'Sabato',
-        'Domenica',
-    )
-    special_weekdays_italian = (
-        'ieri',
-        'oggi',
-        'domani',
-    )
-    identifiers_italian = weekdays_italian + special_weekdays_italian
-
-    weekdays_english = (
-        'Monday',
-        'Tuesday',
-        'Wednesday',
-        'Thursday',
-        'Friday',
-        'Saturday',
-        'Sunday',
-    )
-    special_weekdays_english = (
-        'yesterday',
-        'today',
-        'tomorrow',
-    )
-    identifiers_english = weekdays_english + special_weekdays_english
-
-    identifiers = {
-        'german': identifiers_german,
-        'french': identifiers_french,
-        'italian': identifiers_italian,
-        'english': identifiers_english,
-    }
-
-    recent_date_regex = r'''(?x)
-                            (?P<weekday>[a-zA-z\'ì]+)
-                            \s*,\s*
-                            (?P<hour>\d{2})(:|h)
-                            (?P<minute>\d{2})
-                            (:
-                                (?P<second>\d{2})
-                            )?
-                        '''
-    recent_date_match = re.match(recent_date_regex, input_string)
-    if recent_date_match:
-        # This depends on correct date settings in Kodi...
-        today = datetime.date.today()
-        # wdl = [x for x in weekdays if input_string.startswith(x)]
-        for key in list(identifiers.keys()):
-            wdl = [x for x in identifiers[key] if re.match(
-                x, input_string, re.IGNORECASE)]
-            lang = key
-            if wdl:
-                break
-        if not wdl:
-            return None
-        index = identifiers[lang].index(wdl[0])
-        if index == 9:  # tomorrow
-            offset = datetime.timedelta(1)
-        elif index == 8:  # today
-            offset = datetime.timedelta(0)
-        elif index == 7:  # yesterday
-            offset = datetime.timedelta(-1)
-        else:  # Monday, Tuesday, ..., Sunday
-            days_off_pos = (today.weekday() - index) % 7
-            offset = datetime.timedelta(-days_off_pos)
-        try:
-            hour = int(recent_date_match.group('hour'))
-            minute = int(recent_date_match.group('minute'))
-            time = datetime.time(hour, minute)
-        except ValueError:
-            return None
-        try:
-            second = int(recent_date_match.group('second'))
-            time = datetime.time(hour, minute, second)
-        except (ValueError, TypeError):
-            pass
-        date_time = datetime.datetime.combine(today, time) + offset
-    else:
+    recent_date_match = _RECENT_DATE_REGEX.match(input_string)
+    if not recent_date_match:
         return None
-    return date_time
+    index = _WEEKDAY_INDEX.get(recent_date_match.group('weekday').lower())
+    if index is None:
+        return None
+    # This depends on correct date settings in Kodi...
+    today = datetime.date.today()
+    if index == 9:  # tomorrow
+        offset = datetime.timedelta(1)
+    elif index == 8:  # today
+        offset = datetime.timedelta(0)
+    elif index == 7:  # yesterday
+        offset = datetime.timedelta(-1)
+    else:  # Monday, Tuesday, ..., Sunday
+        days_off_pos = (today.weekday() - index) % 7
+        offset = datetime.timedelta(-days_off_pos)
+    try:
+        hour = int(recent_date_match.group('hour'))
+        minute = int(recent_date_match.group('minute'))
+        time = datetime.time(hour, minute)
+    except ValueError:
+        return None
+    try:
+        second = int(recent_date_match.group('second'))
+        time = datetime.time(hour, minute, second)
+    except (ValueError, TypeError):
+        pass
+    return datetime.datetime.combine(today, time) + offset
 
 
 def _parse_date_time(input_string):
@@ -324,18 +314,7 @@ def _parse_date_time(input_string):
     Keyword arguments:
     input_string -- the date and time in the above form
     """
-    full_date_regex = r'''(?x)
-                        (?P<day>\d{2})\.
-                        (?P<month>\d{2})\.
-                        (?P<year>\d{4})
-                        \s*,?\s*
-                        (?P<hour>\d{2})(:|h)
-                        (?P<minute>\d{2})
-                        (:
-                            (?P<second>\d{2})
-                        )?
-                    '''
-    full_date_match = re.match(full_date_regex, input_string)
+    full_date_match = _FULL_DATE_REGEX.match(input_string)
     if full_date_match:
         try:
             year = int(full_date_match.group('year'))
@@ -356,6 +335,66 @@ def _parse_date_time(input_string):
     return None
 
 
+def datetime_sort_key(date_time):
+    """
+    Converts a datetime object into a compact integer of the form
+    YYYYMMDDhhmmss, which preserves the chronological order.
+
+    Keyword arguments:
+    date_time -- a datetime object
+    """
+    return (((((date_time.year * 100 + date_time.month) * 100 +
+               date_time.day) * 100 + date_time.hour) * 100 +
+             date_time.minute) * 100 + date_time.second)
+
+
+def merge_descending(iterables):
+    """
+    Lazily merges several iterables of tuples (key, item), each of them
+    sorted by descending keys, into one iterator sorted by descending
+    keys. An iterable is only advanced when its current head has been
+    consumed. The keys must be numbers.
+
+    Keyword arguments:
+    iterables  -- a list of iterables of tuples (key, item)
+    """
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for key, item in iterator:
+            heap.append((-key, index, item, iterator))
+            break
+    heapq.heapify(heap)
+    while heap:
+        neg_key, index, item, iterator = heap[0]
+        yield -neg_key, item
+        for key, next_item in iterator:
+            heapq.heapreplace(heap, (-key, index, next_item, iterator))
+            break
+        else:
+            heapq.heappop(heap)
+
+
+def iter_unique(iterables, key=None):
+    """
+    Lazily chains several iterables and yields every element only once
+    (the first occurrence), preserving the order.
+
+    Keyword arguments:
+    iterables  -- an iterable of iterables
+    key        -- a function computing the (hashable) value by which the
+                  elements are compared; if None, the elements themselves
+                  are compared (default: None)
+    """
+    seen = set()
+    for iterable in iterables:
+        for elem in iterable:
+            value = elem if key is None else key(elem)
+            if value not in seen:
+                seen.add(value)
+                yield elem
+
+
 def generate_unique_list(input, unique_key):
     """
     Merges a list of similar dictionaries (at least one key has to be
@@ -365,14 +404,306 @@ def generate_unique_list(input, unique_key):
     input       -- a list of similar dictionaries
     unique_key  -- the key which is taken to compare the values
     """
-    unique_keys = []
-    output = []
-    for li in input:
-        for elem in li:
-            if elem[unique_key] not in unique_keys:
-                unique_keys.append(elem[unique_key])
-                output.append(elem)
-    return output
+    return list(iter_unique(input, key=lambda elem: elem[unique_key]))
+
+
+def parallel_imap_unordered(function, iterable, max_workers=8,
+                            timeout=None):
+    """
+    Applies a function to every element of an iterable by using a bounded
+    pool of threads. Yields tuples (element, result) as soon as the single
+    results are available, so the order of the output is not defined.
+    Elements for which the function raises an exception are skipped.
+
+    Keyword arguments:
+    function     -- the function to apply (takes exactly one argument)
+    iterable     -- the input elements
+    max_workers  -- the maximum number of threads to use (default: 8)
+    timeout      -- the maximum number of seconds to wait for all the
+                    results; results which are not available by then
+                    are skipped (default: None, wait forever)
+    """
+    elements = list(iterable)
+    if not elements:
+        return
+    if max_workers <= 1 or len(elements) == 1:
+        for element in elements:
+            try:
+                result = function(element)
+            except Exception:
+                continue
+            yield element, result
+        return
+
+    lock = threading.Lock()
+    pending = iter(elements)
+    results = queue.Queue()
+
+    def worker():
+        while True:
+            with lock:
+                try:
+                    element = next(pending)
+                except StopIteration:
+                    return
+            try:
+                results.put((element, function(element), True))
+            except Exception:
+                results.put((element, None, False))
+
+    for _ in range(min(max_workers, len(elements))):
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+
+    deadline = time.time() + timeout if timeout is not None else None
+    for _ in range(len(elements)):
+        try:
+            if deadline is None:
+                element, result, success = results.get()
+            else:
+                element, result, success = results.get(
+                    timeout=max(deadline - time.time(), 0))
+        except queue.Empty:
+            return
+        if success:
+            yield element, result
+
+
+def parallel_map(function, iterable, max_workers=8, default=None,
+                 timeout=None):
+    """
+    Applies a function to every element of an iterable by using a bounded
+    pool of threads and returns the results as a list in the order of the
+    input. If the function raises an exception for an element (or does
+    not return in time), the corresponding result will be set to the
+    default value.
+
+    Keyword arguments:
+    function     -- the function to apply (takes exactly one argument)
+    iterable     -- the input elements
+    max_workers  -- the maximum number of threads to use (default: 8)
+    default      -- the result for elements that raised an
+                    exception (default: None)
+    timeout      -- see parallel_imap_unordered (default: None)
+    """
+    elements = list(iterable)
+    results = [default] * len(elements)
+    for index, result in parallel_imap_unordered(
+            lambda index: function(elements[index]), range(len(elements)),
+            max_workers=max_workers, timeout=timeout):
+        results[index] = result
+    return results
+
+
+class LRUCache(object):
+    """
+    A thread safe, bounded mapping which discards the least recently
+    used entries once the maximum size is reached.
+    """
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Returns the value stored for a given key (and marks it as
+        recently used) or the default value if the key is not present.
+
+        Keyword arguments:
+        key      -- the key to look up
+        default  -- the value to return for missing keys (default: None)
+        """
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def set(self, key, value):
+        """
+        Stores a value for a given key.
+
+        Keyword arguments:
+        key    -- the key
+        value  -- the value to store
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all the entries.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class lazy_property(object):
+    """
+    Decorator turning a method without arguments into an attribute which
+    is computed on first access and then stored in the instance. The
+    attribute can also be assigned.
+    """
+    def __init__(self, function):
+        self.function = function
+        self.__doc__ = function.__doc__
+        self._lock = threading.RLock()
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        values = instance.__dict__.setdefault('_lazy_property_values', {})
+        try:
+            return values[self]
+        except KeyError:
+            pass
+        with self._lock:
+            if self not in values:
+                values[self] = self.function(instance)
+            return values[self]
+
+    def __set__(self, instance, value):
+        instance.__dict__.setdefault(
+            '_lazy_property_values', {})[self] = value
+
+
+# A double quote, also in its entity encoded form:
+_QUOTE = r'(?:"|&quot;)'
+
+
+def find_unique_ids(text, id_pattern, flag=None):
+    """
+    Scans a text (e.g. a webpage with embedded JavaScript) in a single
+    pass for key value pairs of the form "id": "<id>" and returns the
+    list of the ids without duplicates, in the order of their first
+    occurrence. The quotes may also be encoded as &quot;.
+
+    Keyword arguments:
+    text        -- the text to scan
+    id_pattern  -- a regular expression (without groups) for the ids
+    flag        -- if given, only ids followed by "<flag>": true in the
+                   same object (not in a nested one) are returned
+                   (default: None)
+    """
+    # The patterns start with a literal, so that the regex engine can
+    # skip quickly to the candidates. The opening quote is checked
+    # separately.
+    id_regex = re.compile(r'id%(q)s\s*:\s*%(q)s(%(id)s)%(q)s' % {
+        'q': _QUOTE, 'id': id_pattern})
+    scope_regex = None
+    if flag:
+        scope_regex = re.compile(r'[{}]|%s%s\s*:\s*true' % (
+            re.escape(flag), _QUOTE))
+    seen = set()
+    id_list = []
+    for match in id_regex.finditer(text):
+        if not (text.endswith('"', 0, match.start()) or
+                text.endswith('&quot;', 0, match.start())):
+            continue
+        vid = match.group(1)
+        if vid in seen:
+            continue
+        if scope_regex is None or _is_flagged(
+                text, match.end(), scope_regex):
+            seen.add(vid)
+            id_list.append(vid)
+    return id_list
+
+
+def _is_flagged(text, position, scope_regex):
+    """
+    Checks if the flag of a scope regex (see find_unique_ids) follows a
+    given position of a text in the same object. The braces of nested
+    objects are counted (braces within strings are not recognized).
+
+    Keyword arguments:
+    text         -- the text
+    position     -- the position (in the object) to start from
+    scope_regex  -- a compiled regex matching braces and the flag
+    """
+    depth = 0
+    for match in scope_regex.finditer(text, position):
+        token = match.group(0)
+        if token == '{':
+            depth += 1
+        elif token == '}':
+            if not depth:
+                return False
+            depth -= 1
+        elif not depth:
+            return True
+    return False
+
+
+def iter_json_array(chunks, key):
+    """
+    Incrementally parses a JSON document given as chunks of UTF-8 encoded
+    bytes and yields the elements of the array which is the value of the
+    first occurrence of a given key. Only the current element is kept in
+    memory, not the whole document.
+
+    Keyword arguments:
+    chunks  -- an iterable of byte strings
+    key     -- the key of the array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    start_regex = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    chunks = iter(chunks)
+    buf = u''
+    in_array = False
+    exhausted = False
+    while True:
+        if not in_array:
+            match = start_regex.search(buf)
+            if match:
+                buf = buf[match.end():]
+                in_array = True
+                continue
+            # The key might be split between two chunks:
+            buf = buf[-(len(key) + 64):]
+        else:
+            index = 0
+            while index < len(buf) and buf[index] in u' \t\r\n,':
+                index += 1
+            if index < len(buf):
+                if buf[index] == u']':
+                    return
+                try:
+                    element, end = decoder.raw_decode(buf, index)
+                except ValueError:
+                    # Incomplete element, more data is needed
+                    if exhausted:
+                        return
+                else:
+                    # A number may continue in the next chunk (e.g. '12'
+                    # of '12345' or '-6' of '-6.5'), so an element is
+                    # only complete once the next delimiter (or the end
+                    # of the data) arrived.
+                    if exhausted or (
+                            end < len(buf) and buf[end] in u' \t\r\n,]'):
+                        buf = buf[end:]
+                        yield element
+                        continue
+            else:
+                buf = u''
+        if exhausted:
+            return
+        try:
+            buf += text_decoder.decode(next(chunks))
+        except StopIteration:
+            buf += text_decoder.decode(b'', True)
+            exhausted = True
 
 
 def is_python_2():
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the showcatalog module.
+
+Usage: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lib'))
+
+import showcatalog  # noqa: E402
+
+SHOWS = [
+    {'id': '1', 'title': u'Tagesschau', 'lead': u'Nachrichten',
+     'description': u'Die Sendung über das Weltgeschehen'},
+    {'id': '2', 'title': u'Kassensturz', 'lead': u'Konsum',
+     'description': u'Tests und Tipps, nicht nur zur Tagesschau-Zeit'},
+    {'id': '3', 'title': u'Schweiz aktuell', 'lead': None,
+     'description': u'Berichte aus der Région'},
+    {'id': '4', 'title': u'SRF bi de Lüt', 'lead': u'Reportage',
+     'description': None},
+]
+
+
+class ShowSearchTest(unittest.TestCase):
+    def search(self, query):
+        catalog = showcatalog.ShowCatalog(SHOWS)
+        return [show['id'] for show in catalog.search(query)]
+
+    def test_case_and_accents_are_folded(self):
+        self.assertEqual(self.search(u'TAGESSCHAU'), ['1', '2'])
+        self.assertEqual(self.search(u'uber'), ['1'])
+        self.assertEqual(self.search(u'REGION'), ['3'])
+        self.assertEqual(self.search(u'Lüt'), ['4'])
+        self.assertEqual(self.search(b'l\xc3\xbct'), ['4'])
+
+    def test_all_words_must_match(self):
+        self.assertEqual(self.search(u'tests tipps'), ['2'])
+        self.assertEqual(self.search(u'tests region'), [])
+        self.assertEqual(self.search(u'xyz'), [])
+
+    def test_words_shorter_than_three_characters(self):
+        # No trigrams, all the shows are verified against the texts
+        self.assertEqual(self.search(u'bi'), ['4'])
+        self.assertEqual(self.search(u'de lüt'), ['4'])
+        self.assertEqual(self.search(u'!?'), [])
+
+    def test_title_matches_come_first(self):
+        # 'sch' is in the titles of the shows 1 and 3, but only in the
+        # description of show 2. Otherwise the catalog order is kept.
+        self.assertEqual(self.search(u'sch'), ['1', '3', '2'])
+        self.assertEqual(self.search(u'ber'), ['1', '3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
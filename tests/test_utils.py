@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2018 Alexander Seiler
+#
+#
+# This file is part of script.module.srgssr.
+#
+# script.module.srgssr is free software: you can redistribute it and/or
+# modify it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# script.module.srgssr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with script.module.srgssr.
+# If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tests for the utils module.
+
+Usage: python -m unittest discover tests
+"""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, 'lib'))
+
+import utils  # noqa: E402
+
+
+def split(data, size):
+    """
+    Splits a byte string into chunks of a given size.
+    """
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class IterJsonArrayTest(unittest.TestCase):
+    def parse(self, document, size, key='Show'):
+        return list(utils.iter_json_array(
+            split(document.encode('utf-8'), size), key))
+
+    def test_scalars_split_between_chunks(self):
+        document = u'{"Show": [12345, -6.5e3, true, null, "x y"]}'
+        for size in range(1, len(document) + 1):
+            self.assertEqual(
+                self.parse(document, size),
+                [12345, -6.5e3, True, None, u'x y'], 'chunk size %d' % size)
+
+    def test_trailing_number_at_the_end_of_the_data(self):
+        for size in (1, 2, 3, 100):
+            self.assertEqual(self.parse(u'"Show":[12345', size), [12345])
+
+    def test_objects_split_between_chunks(self):
+        shows = [{u'id': u'%d' % i, u'title': u'Sendung \xe4 %d' % i}
+                 for i in range(20)]
+        document = json.dumps(
+            {u'AssetGroups': {u'Show': shows}}, ensure_ascii=False)
+        for size in (1, 2, 3, 7, 64, len(document.encode('utf-8'))):
+            self.assertEqual(self.parse(document, size), shows)
+
+    def test_missing_key(self):
+        self.assertEqual(self.parse(u'{"Other": [1, 2]}', 2), [])
+
+
+class FindUniqueIdsTest(unittest.TestCase):
+    def test_unique_ids_in_order(self):
+        text = (u'{&quot;id&quot;:&quot;2&quot;},{"id": "1"},'
+                u'{&quot;id&quot;:&quot;2&quot;},{"videoid": "3"}')
+        self.assertEqual(utils.find_unique_ids(text, r'\d+'), [u'2', u'1'])
+
+    def test_flag_of_the_enclosing_object(self):
+        text = (u'[{"id": "1", "show": {"id": "2"}, "isEditorPick": true},'
+                u'{"id": "3", "show": {"id": "4", "isEditorPick": true}},'
+                u'{"id": "5", "isEditorPick": false}, "isEditorPick": true]')
+        self.assertEqual(
+            utils.find_unique_ids(text, r'\d+', flag='isEditorPick'),
+            [u'1', u'4'])
+
+
+class MergeDescendingTest(unittest.TestCase):
+    def test_merge_is_lazy(self):
+        consumed = []
+
+        def stream(name, keys):
+            for key in keys:
+                consumed.append((name, key))
+                yield key, '%s%d' % (name, key)
+
+        merged = utils.merge_descending(
+            [stream('a', [9, 5, 1]), stream('b', [8, 7, 6, 2])])
+        self.assertEqual(next(merged), (9, 'a9'))
+        self.assertEqual(next(merged), (8, 'b8'))
+        # A stream is only advanced once its head has been consumed:
+        self.assertEqual(consumed, [('a', 9), ('b', 8), ('a', 5)])
+        self.assertEqual([key for key, _ in merged], [7, 6, 5, 2, 1])
+
+    def test_ties_keep_the_order_of_the_streams(self):
+        streams = [[(3, 'a3'), (1, 'a1')], [(3, 'b3'), (1, 'b1')],
+                   [(3, 'c3'), (2, 'c2')]]
+        self.assertEqual(
+            [item for _, item in utils.merge_descending(streams)],
+            ['a3', 'b3', 'c3', 'c2', 'a1', 'b1'])
+
+    def test_empty_streams(self):
+        self.assertEqual(list(utils.merge_descending([[], [(1, 'x')]])),
+                         [(1, 'x')])
+        self.assertEqual(list(utils.merge_descending([])), [])
+
+
+if __name__ == '__main__':
+    unittest.main()